@@ -9,6 +9,12 @@ from importlib.metadata import version
 
 import yaml  # type: ignore
 
+try:
+    # libyaml C extension, much faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader  # type: ignore
+except ImportError:  # pragma: nocover
+    from yaml import SafeLoader  # type: ignore
+
 
 def main():
     """Check if the version in Chart.yaml matches titiler-eopf package version"""
@@ -17,7 +23,7 @@ def main():
 
     # Read Chart.yaml
     with open("helm/charts/Chart.yaml", "r") as f:
-        chart = yaml.safe_load(f)
+        chart = yaml.load(f, Loader=SafeLoader)
 
     app_version = chart.get("appVersion", "").strip('"')
 
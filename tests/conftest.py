@@ -1,16 +1,23 @@
 """titiler.eopf tests configuration."""
 
+import hashlib
 import os
 import shutil
-from threading import Thread
-from typing import Any, Generator
+import struct
+from typing import Any, AsyncGenerator, Generator
 
+import fakeredis
+import httpx
 import jinja2
+import morecantile
 import pytest
-from fakeredis import TcpFakeServer
+import pytest_asyncio
 from rasterio.io import MemoryFile
 from starlette.testclient import TestClient
 
+from titiler.cache.utils import CacheKeyGenerator
+from titiler.eopf.reader import GeoZarrReader
+
 from .create_multiscale_fixture import (
     create_geozarr_fixture,
     create_zarr_with_scale_offset,
@@ -18,18 +25,62 @@ from .create_multiscale_fixture import (
 
 FIXTURES_DIRECTORY = os.path.join(os.path.dirname(__file__), "fixtures")
 
+# Stores built by an older version of the fixture script get a new cache directory
+with open(
+    os.path.join(os.path.dirname(__file__), "create_multiscale_fixture.py"), "rb"
+) as f:
+    FIXTURE_SCRIPT_HASH = hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def _create_cached_geozarr(request, fixture_path: str, **kwargs) -> None:
+    """Create a GeoZarr fixture at `fixture_path`, reusing the pytest cache.
+
+    The store is generated once under the pytest cache directory (generation
+    is skipped when it is up to date) and linked (or copied where symlinks are
+    not supported) into the fixtures directory.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        create_geozarr_fixture(fixture_path, **kwargs)
+        return
+
+    cache_dir = cache.mkdir(f"geozarr-{FIXTURE_SCRIPT_HASH}")
+    cached_path = os.path.join(cache_dir, os.path.basename(fixture_path))
+    create_geozarr_fixture(cached_path, **kwargs)
+
+    os.makedirs(os.path.dirname(fixture_path), exist_ok=True)
+    if os.path.islink(fixture_path):
+        os.unlink(fixture_path)
+    elif os.path.exists(fixture_path):
+        shutil.rmtree(fixture_path)
+
+    try:
+        os.symlink(cached_path, fixture_path, target_is_directory=True)
+    except OSError:
+        shutil.copytree(cached_path, fixture_path)
+
+
+@pytest.fixture(scope="session")
+def redis_server() -> fakeredis.FakeServer:
+    """In-process FakeRedis server shared by the app and the tests."""
+    return fakeredis.FakeServer()
+
 
 @pytest.fixture(scope="session")
-def redis_host() -> Generator[str, Any, Any]:
-    """FakeRedis fixture."""
-    server_address = ("127.0.0.1", 6379)  # Use non-standard port to avoid conflicts
-    server = TcpFakeServer(server_address, server_type="redis")
-    t = Thread(target=server.serve_forever, daemon=True)
-    t.start()
-    yield server_address[0]
-    server.shutdown()
-    server.server_close()
-    t.join()
+def redis_host(redis_server) -> Generator[str, Any, Any]:
+    """Route Redis clients to the shared FakeRedis server (no socket)."""
+
+    def sync_client(*args, **kwargs):
+        return fakeredis.FakeStrictRedis(server=redis_server)
+
+    def async_client(*args, **kwargs):
+        return fakeredis.FakeAsyncRedis(server=redis_server)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("redis.Redis", sync_client)
+        mp.setattr("redis.from_url", sync_client)
+        mp.setattr("redis.asyncio.Redis", async_client)
+        yield "127.0.0.1"
 
 
 @pytest.fixture(
@@ -41,7 +92,7 @@ def geozarr(request):
     version = request.param
     collection_dir = os.path.join(FIXTURES_DIRECTORY, "eopf")
     geozarr = os.path.join(collection_dir, f"geozarr_{version}.zarr")
-    create_geozarr_fixture(geozarr, version=version)
+    _create_cached_geozarr(request, geozarr, version=version)
     yield ("eopf", f"geozarr_{version}")
     if os.path.exists(collection_dir):
         shutil.rmtree(collection_dir)
@@ -54,6 +105,27 @@ def geozarr_dataset(geozarr):
     return os.path.join(FIXTURES_DIRECTORY, collection, f"{item}.zarr")
 
 
+@pytest.fixture(scope="module")
+def src(geozarr) -> Generator[GeoZarrReader, Any, Any]:
+    """GeoZarrReader for the geozarr fixture, opened once per test module.
+
+    Shared by the tests as is: they only read from it. A test that needs to
+    change the reader state should open its own reader instead.
+    """
+    collection, item = geozarr
+    dataset = os.path.join(FIXTURES_DIRECTORY, collection, f"{item}.zarr")
+    with GeoZarrReader(dataset) as src:
+        yield src
+
+
+@pytest.fixture(scope="module")
+def center(src) -> tuple[float, float, morecantile.Tile]:
+    """Center (lon, lat) of the src dataset and the zoom 10 tile containing it."""
+    bounds = src.bounds
+    lon, lat = (bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2
+    return lon, lat, src.tms.tile(lon, lat, 10)
+
+
 @pytest.fixture
 def geozarr_so():
     """Create GeoZarr with scale offset."""
@@ -79,24 +151,34 @@ def geozarr_stac(geozarr_dataset):
     return template.render(store_url=f"file://{geozarr_dataset}")
 
 
-@pytest.fixture
-def geozarr_3d():
+@pytest.fixture(scope="module")
+def geozarr_3d(request):
     """Create GeoZarr v1 with time dimension fixture."""
     collection_dir = os.path.join(FIXTURES_DIRECTORY, "eopf3d")
     geozarr = os.path.join(collection_dir, "geozarr_with_time.zarr")
-    create_geozarr_fixture(geozarr, version="v1", with_time=True)
+    _create_cached_geozarr(request, geozarr, version="v1", with_time=True)
     yield ("eopf3d", "geozarr_with_time")
     if os.path.exists(collection_dir):
         shutil.rmtree(collection_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def geozarr_3d_dataset(geozarr_3d):
     """GeoZarr dataset path."""
     collection, item = geozarr_3d
     return os.path.join(FIXTURES_DIRECTORY, collection, f"{item}.zarr")
 
 
+@pytest.fixture(scope="module")
+def src_3d(geozarr_3d_dataset) -> Generator[GeoZarrReader, Any, Any]:
+    """GeoZarrReader for the geozarr_3d fixture, opened once per test module.
+
+    Read-only, like `src`.
+    """
+    with GeoZarrReader(geozarr_3d_dataset) as src:
+        yield src
+
+
 @pytest.fixture
 def geozarr_3d_stac(geozarr_3d_dataset):
     """Create GeoZARR STAC Item."""
@@ -111,43 +193,87 @@ def geozarr_3d_stac(geozarr_3d_dataset):
     return template.render(store_url=f"file://{geozarr_3d_dataset}")
 
 
-@pytest.fixture(autouse=True)
-def set_env(redis_host, monkeypatch) -> Generator[TestClient, Any, Any]:
-    """Set env variables for tests"""
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "jqt")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "rde")
-    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-west-2")
-    monkeypatch.setenv("AWS_REGION", "us-west-2")
-    monkeypatch.delenv("AWS_PROFILE", raising=False)
-    monkeypatch.setenv("AWS_CONFIG_FILE", "/tmp/noconfigheere")
-
-    # Fake data store - override any .env file settings
-    monkeypatch.setenv("TITILER_EOPF_STORE_SCHEME", "file")
-    monkeypatch.setenv("TITILER_EOPF_STORE_HOST", os.path.dirname(__file__))
-    monkeypatch.setenv("TITILER_EOPF_STORE_PATH", "fixtures")
-    monkeypatch.setenv(
-        "TITILER_EOPF_STORE_URL", f"file://{os.path.dirname(__file__)}/fixtures"
-    )
+@pytest.fixture(scope="session", autouse=True)
+def set_env(redis_host) -> Generator[None, Any, Any]:
+    """Set env variables for tests (once per session, shared by the app)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AWS_ACCESS_KEY_ID", "jqt")
+        mp.setenv("AWS_SECRET_ACCESS_KEY", "rde")
+        mp.setenv("AWS_DEFAULT_REGION", "us-west-2")
+        mp.setenv("AWS_REGION", "us-west-2")
+        mp.delenv("AWS_PROFILE", raising=False)
+        mp.setenv("AWS_CONFIG_FILE", "/tmp/noconfigheere")
 
-    # Redis Cache
-    monkeypatch.setenv("TITILER_EOPF_CACHE_HOST", redis_host)
-    monkeypatch.setenv("TITILER_EOPF_CACHE_ENABLE", "TRUE")
+        # Fake data store - override any .env file settings
+        mp.setenv("TITILER_EOPF_STORE_SCHEME", "file")
+        mp.setenv("TITILER_EOPF_STORE_HOST", os.path.dirname(__file__))
+        mp.setenv("TITILER_EOPF_STORE_PATH", "fixtures")
+        mp.setenv(
+            "TITILER_EOPF_STORE_URL", f"file://{os.path.dirname(__file__)}/fixtures"
+        )
 
-    # STAC API
-    monkeypatch.setenv("TITILER_EOPF_STAC_API_URL", "https://fake.api.io/stac")
+        # Redis Cache
+        mp.setenv("TITILER_EOPF_CACHE_HOST", redis_host)
+        mp.setenv("TITILER_EOPF_CACHE_ENABLE", "TRUE")
 
+        # STAC API
+        mp.setenv("TITILER_EOPF_STAC_API_URL", "https://fake.api.io/stac")
 
-@pytest.fixture
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_sleep() -> Generator[None, Any, Any]:
+    """Make retry backoffs (e.g. in the openEO `_reader`) instantaneous."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("time.sleep", lambda seconds: None)
+        yield
+
+
+@pytest.fixture(scope="session")
 def app(set_env) -> Generator[TestClient, Any, Any]:
-    """Create App."""
+    """Create App (shared by the whole session, lifespan runs once)."""
     from titiler.eopf.main import app
 
     with TestClient(app) as app:
         yield app
 
 
+@pytest_asyncio.fixture
+async def async_app(app) -> AsyncGenerator[httpx.AsyncClient, Any]:
+    """Async client for the shared app, to send concurrent requests."""
+    transport = httpx.ASGITransport(app=app.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver", follow_redirects=True
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def key_generator() -> CacheKeyGenerator:
+    """Cache key generator shared by the cache tests."""
+    return CacheKeyGenerator("test-app")
+
+
 def parse_img(content: bytes) -> dict[Any, Any]:
     """Read tile image and return metadata."""
     with MemoryFile(content) as mem:
         with mem.open() as dst:
             return dst.profile
+
+
+# PNG color type -> number of samples per pixel
+PNG_COLOR_TYPE_COUNT = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+def parse_img_header(content: bytes) -> dict[Any, Any]:
+    """Read PNG metadata from the IHDR chunk, without decoding the image."""
+    assert content[:8] == b"\x89PNG\r\n\x1a\n", "not a PNG image"
+    width, height = struct.unpack(">II", content[16:24])
+    bit_depth, color_type = content[24], content[25]
+    return {
+        "width": width,
+        "height": height,
+        "count": PNG_COLOR_TYPE_COUNT[color_type],
+        "dtype": "uint16" if bit_depth == 16 else "uint8",
+    }
@@ -3,20 +3,24 @@
 Script to create a optimized pyramid test fixture that mimics the new S2 optimization structure.
 """
 
+import hashlib
 import math
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Literal
 
 import numpy as np
-import rioxarray  # noqa: F401
-import xarray as xr
-import zarr
-from affine import Affine
-from pyproj import CRS
-from xarray.backends.zarr import FillValueCoder
-from zarr.codecs import BloscCodec, CastValue, ScaleOffset
+
+# NOTE: xarray/rioxarray/zarr/pyproj are imported inside the generators so that
+# importing this module (e.g. from conftest during collection) stays cheap.
+
+# Bump when the generator output changes so existing fixtures get rebuilt
+FIXTURE_REVISION = 4
+
+# Chunk (and v0 tile matrix tile) size of the fixture arrays, in pixels
+SPATIAL_CHUNK = 256
 
 spatial_conventions = {
     "schema_url": "https://raw.githubusercontent.com/zarr-conventions/spatial/refs/tags/v1/schema.json",
@@ -40,14 +44,73 @@ multiscale_conventions = {
     "description": "Multiscale layout of zarr datasets",
 }
 
+# Shared by the multiscale group and every band array (never mutated)
+multiscale_zarr_conventions = (
+    spatial_conventions,
+    proj_conventions,
+    multiscale_conventions,
+)
+
 
 def create_geozarr_fixture(  # noqa: C901
     fixture_path: str,
     version: Literal["v0", "v1"] = "v0",
     with_time: bool = False,
 ):
-    """Create a optimized pyramid fixture with different variables at different scales."""
+    """Create a optimized pyramid fixture with different variables at different scales.
+
+    Generation is skipped when `fixture_path` already holds a fixture built
+    from the same parameters.
+    """
+    import rioxarray  # noqa: F401
+    import xarray as xr
+    import zarr
+    from pyproj import CRS
+    from zarr.codecs import BloscCodec
+
+    # Base spatial parameters
+    base_x_10m = np.arange(500000, 510000, 10, dtype=np.float64)  # 10m pixel size
+    base_y_10m = np.arange(4200000, 4190000, -10, dtype=np.float64)
+
+    base_x_20m = np.arange(500000, 510000, 20, dtype=np.float64)  # 20m pixel size
+    base_y_20m = np.arange(4200000, 4190000, -20, dtype=np.float64)
+
+    base_x_60m = np.arange(500000, 510000, 60, dtype=np.float64)  # 60m pixel size
+    base_y_60m = np.arange(4200000, 4190000, -60, dtype=np.float64)
+
+    base_x_120m = np.arange(500000, 510000, 120, dtype=np.float64)  # 120m pixel size
+    base_y_120m = np.arange(4200000, 4190000, -120, dtype=np.float64)
+
+    bands_10m = ["b02", "b03", "b04", "b08"]
+    all_bands = ["b02", "b03", "b04", "b05", "b06", "b07", "b08", "b11", "b12", "b8a"]
+
+    # (x coords, y coords, v1 group name, resolution in meters, bands)
+    # Level 0 (10m) only holds the native 10m bands, coarser levels hold all bands
+    levels = [
+        (base_x_10m, base_y_10m, "r10m", 10, bands_10m),
+        (base_x_20m, base_y_20m, "r20m", 20, all_bands),
+        (base_x_60m, base_y_60m, "r60m", 60, all_bands),
+        (base_x_120m, base_y_120m, "r120m", 120, all_bands),
+    ]
+
+    fixture_hash = hashlib.sha256(
+        repr(
+            (version, with_time, [level[2:] for level in levels], FIXTURE_REVISION)
+        ).encode()
+    ).hexdigest()
+
     if os.path.exists(fixture_path):
+        try:
+            existing_hash = zarr.open_group(fixture_path, mode="r").attrs.get(
+                "_fixture_hash"
+            )
+        except Exception:  # noqa: BLE001 - anything unreadable gets regenerated
+            existing_hash = None
+
+        if existing_hash == fixture_hash:
+            print(f"✅ GeoZarr ({version}) fixture at {fixture_path} is up to date")
+            return fixture_path
+
         shutil.rmtree(fixture_path)
 
     # Create zarr store
@@ -56,42 +119,48 @@ def create_geozarr_fixture(  # noqa: C901
     # Define CRS and transform (similar to existing fixture)
     crs = CRS.from_epsg(32633)  # WGS 84 / UTM zone 33N
 
-    # Create compressor for encoding
-    compressor = BloscCodec(cname="zstd", clevel=3, shuffle="shuffle", blocksize=0)
+    # Create compressor for encoding (fast LZ4; fixtures are written once, ratio is irrelevant)
+    compressor = BloscCodec(cname="lz4", clevel=1, shuffle="bitshuffle", blocksize=0)
+
+    def create_encoding(ds, spatial_chunk=SPATIAL_CHUNK, shard_size=1024):
+        """Create encoding for dataset variables.
 
-    def create_encoding(ds, spatial_chunk=64):
-        """Create encoding for dataset variables."""
+        Arrays with a side of at least `shard_size / 2` pixels are sharded so
+        their chunks are grouped into a few objects on disk.
+        """
         encoding = {}
         for var in ds.data_vars:
             data_shape = ds[var].shape
             if len(data_shape) >= 2:
+                # One chunk per step along any leading (e.g. time) dimension
+                leading = (1,) * (len(data_shape) - 2)
                 chunk_y = min(spatial_chunk, data_shape[-2])
                 chunk_x = min(spatial_chunk, data_shape[-1])
-                chunks = (chunk_y, chunk_x)
+                chunks = (*leading, chunk_y, chunk_x)
             else:
                 chunks = (min(spatial_chunk, data_shape[-1]),)
 
-            encoding[var] = {"compressors": [compressor], "chunks": chunks}
+            # Chunks holding only the fill value are not written to disk
+            encoding[var] = {
+                "compressors": [compressor],
+                "chunks": chunks,
+                "write_empty_chunks": False,
+            }
+
+            if len(data_shape) >= 2 and max(data_shape[-2:]) >= shard_size // 2:
+                # Shard shape must be a multiple of the chunk shape
+                shard_y = min(shard_size, math.ceil(data_shape[-2] / chunk_y) * chunk_y)
+                shard_x = min(shard_size, math.ceil(data_shape[-1] / chunk_x) * chunk_x)
+                encoding[var]["shards"] = (*leading, shard_y, shard_x)
 
-        # Add coordinate encoding
+        # Add coordinate encoding (1D coordinates are stored as a single chunk)
         for coord in ds.coords:
             encoding[coord] = {"compressors": None}
+            if ds[coord].ndim == 1:
+                encoding[coord]["chunks"] = ds[coord].shape
 
         return encoding
 
-    # Base spatial parameters
-    base_x_10m = np.arange(500000, 510000, 10).tolist()  # 10m pixel size
-    base_y_10m = np.arange(4200000, 4190000, -10).tolist()
-
-    base_x_20m = np.arange(500000, 510000, 20).tolist()  # 20m pixel size
-    base_y_20m = np.arange(4200000, 4190000, -20).tolist()
-
-    base_x_60m = np.arange(500000, 510000, 60).tolist()  # 60m pixel size
-    base_y_60m = np.arange(4200000, 4190000, -60).tolist()
-
-    base_x_120m = np.arange(500000, 510000, 120).tolist()  # 120m pixel size
-    base_y_120m = np.arange(4200000, 4190000, -120).tolist()
-
     # Create root group with multiscales metadata
     if version == "v0":
         root_attrs = {
@@ -103,37 +172,37 @@ def create_geozarr_fixture(  # noqa: C901
                             "id": "0",
                             "cellSize": 10.0,
                             "pointOfOrigin": [500000, 4200000],
-                            "matrixWidth": math.ceil(len(base_x_10m) / 64),
-                            "matrixHeight": math.ceil(len(base_y_10m) / 64),
-                            "tileWidth": 64,
-                            "tileHeight": 64,
+                            "matrixWidth": math.ceil(len(base_x_10m) / SPATIAL_CHUNK),
+                            "matrixHeight": math.ceil(len(base_y_10m) / SPATIAL_CHUNK),
+                            "tileWidth": SPATIAL_CHUNK,
+                            "tileHeight": SPATIAL_CHUNK,
                         },  # 10m
                         {
                             "id": "1",
                             "cellSize": 20.0,
                             "pointOfOrigin": [500000, 4200000],
-                            "matrixWidth": math.ceil(len(base_x_20m) / 64),
-                            "matrixHeight": math.ceil(len(base_y_20m) / 64),
-                            "tileWidth": 64,
-                            "tileHeight": 64,
+                            "matrixWidth": math.ceil(len(base_x_20m) / SPATIAL_CHUNK),
+                            "matrixHeight": math.ceil(len(base_y_20m) / SPATIAL_CHUNK),
+                            "tileWidth": SPATIAL_CHUNK,
+                            "tileHeight": SPATIAL_CHUNK,
                         },  # 20m
                         {
                             "id": "2",
                             "cellSize": 60.0,
                             "pointOfOrigin": [500000, 4200000],
-                            "matrixWidth": math.ceil(len(base_x_60m) / 64),
-                            "matrixHeight": math.ceil(len(base_y_60m) / 64),
-                            "tileWidth": 64,
-                            "tileHeight": 64,
+                            "matrixWidth": math.ceil(len(base_x_60m) / SPATIAL_CHUNK),
+                            "matrixHeight": math.ceil(len(base_y_60m) / SPATIAL_CHUNK),
+                            "tileWidth": SPATIAL_CHUNK,
+                            "tileHeight": SPATIAL_CHUNK,
                         },  # 60m
                         {
                             "id": "3",
                             "cellSize": 120.0,
                             "pointOfOrigin": [500000, 4200000],
-                            "matrixWidth": math.ceil(len(base_x_120m) / 64),
-                            "matrixHeight": math.ceil(len(base_y_120m) / 64),
-                            "tileWidth": 64,
-                            "tileHeight": 64,
+                            "matrixWidth": math.ceil(len(base_x_120m) / SPATIAL_CHUNK),
+                            "matrixHeight": math.ceil(len(base_y_120m) / SPATIAL_CHUNK),
+                            "tileWidth": SPATIAL_CHUNK,
+                            "tileHeight": SPATIAL_CHUNK,
                         },  # 120m
                     ],
                 }
@@ -142,11 +211,7 @@ def create_geozarr_fixture(  # noqa: C901
     elif version == "v1":
         # Create root group with multiscales metadata
         root_attrs = {
-            "zarr_conventions": [
-                spatial_conventions,
-                proj_conventions,
-                multiscale_conventions,
-            ],
+            "zarr_conventions": multiscale_zarr_conventions,
             "multiscales": {
                 "layout": [
                     {
@@ -190,81 +255,51 @@ def create_geozarr_fixture(  # noqa: C901
     reflectance_group = store.create_group("measurements/reflectance")
     reflectance_group.attrs.update(root_attrs)
 
-    def create_data_array_v0(
-        name,
-        x_coords,
-        y_coords,
-        scale_factor=0.0001,
-        offset=-0.1,
-        with_time=False,
-    ):
-        """Create a synthetic data array."""
-        height, width = len(y_coords), len(x_coords)
-        # Create synthetic but realistic reflectance data
-        data = np.random.uniform(1000, 8000, (height, width)).astype(np.uint16)
-
-        if with_time:
-            data = np.expand_dims(data, axis=0)  # create 3d array
-            data = np.repeat(data, 2, axis=0)  # replicate array on the time dimension
-            coords = {
-                "y": y_coords,
-                "x": x_coords,
-                "time": [
-                    datetime(2022, 1, 1),
-                    datetime(2022, 1, 2),
-                ],
-            }
-            dims = ["time", "y", "x"]
-
-        else:
-            coords = {"y": y_coords, "x": x_coords}
-            dims = ["y", "x"]
-
-        da = xr.DataArray(
-            data,
-            coords=coords,
-            dims=dims,
-            name=name,
-            attrs={
-                "long_name": f"BOA reflectance from MSI acquisition at spectral band {name}",
-                "units": "digital_counts",
-                "scale_factor": scale_factor,
-                "add_offset": offset,
-                "valid_min": 1,
-                "valid_max": 65535,
-                "fill_value": 0,
-                "proj:epsg": crs.to_epsg(),
-                "proj:transform": [
-                    x_coords[1] - x_coords[0],
-                    0.0,
-                    x_coords[0],
-                    0.0,
-                    y_coords[1] - y_coords[0],
-                    y_coords[0],
-                ],
-                "proj:shape": [height, width],
-                "proj:bbox": [x_coords[0], y_coords[-1], x_coords[-1], y_coords[0]],
-            },
-        )
-
-        # Set CRS and spatial dimensions
-        da = da.rio.write_crs(crs)
-        da = da.rio.set_spatial_dims(x_dim="x", y_dim="y")
+    def create_level_attrs_v0(transform, bbox, shape, scale_factor=0.0001, offset=-0.1):
+        """Create the band attributes shared by every band of a level."""
+        return {
+            "units": "digital_counts",
+            "scale_factor": scale_factor,
+            "add_offset": offset,
+            "valid_min": 1,
+            "valid_max": 65535,
+            "fill_value": 0,
+            "proj:epsg": crs.to_epsg(),
+            "proj:transform": transform,
+            "proj:shape": shape,
+            "proj:bbox": bbox,
+        }
 
-        return da
+    def create_level_attrs_v1(transform, bbox, shape, scale_factor=0.0001, offset=-0.1):
+        """Create the band attributes shared by every band of a level."""
+        return {
+            "zarr_conventions": multiscale_zarr_conventions,
+            "units": "digital_counts",
+            "scale_factor": scale_factor,
+            "add_offset": offset,
+            "valid_min": 1,
+            "valid_max": 65535,
+            "fill_value": 0,
+            "proj:code": f"EPSG:{crs.to_epsg()}",
+            "spatial:dimensions": ["y", "x"],
+            "spatial:transform": transform,
+            "spatial:shape": shape,
+            "spatial:bbox": bbox,
+            "spatial:registration": "pixel",
+        }
 
-    def create_data_array_v1(
+    def create_data_array(
         name,
         x_coords,
         y_coords,
-        scale_factor=0.0001,
-        offset=-0.1,
+        common_attrs,
+        rng,
         with_time=False,
     ):
         """Create a synthetic data array."""
         height, width = len(y_coords), len(x_coords)
         # Create synthetic but realistic reflectance data
-        data = np.random.uniform(1000, 8000, (height, width)).astype(np.uint16)
+        data = rng.integers(1000, 8001, size=(height, width), dtype=np.uint16)
 
         if with_time:
             data = np.expand_dims(data, axis=0)  # create 3d array
@@ -289,49 +324,8 @@ def create_geozarr_fixture(  # noqa: C901
             dims=dims,
             name=name,
             attrs={
-                "zarr_conventions": [
-                    {
-                        "uuid": "d35379db-88df-4056-af3a-620245f8e347",
-                        "schema_url": "https://raw.githubusercontent.com/zarr-conventions/multiscales/refs/tags/v1/schema.json",
-                        "spec_url": "https://github.com/zarr-conventions/multiscales/blob/v1/README.md",
-                        "name": "multiscales",
-                        "description": "Multiscale layout of zarr datasets",
-                    },
-                    {
-                        "uuid": "689b58e2-cf7b-45e0-9fff-9cfc0883d6b4",
-                        "schema_url": "https://raw.githubusercontent.com/zarr-conventions/spatial/refs/tags/v1/schema.json",
-                        "spec_url": "https://github.com/zarr-conventions/spatial/blob/v1/README.md",
-                        "name": "spatial:",
-                        "description": "Spatial coordinate and transformation information",
-                    },
-                    {
-                        "uuid": "f17cb550-5864-4468-aeb7-f3180cfb622f",
-                        "schema_url": "https://raw.githubusercontent.com/zarr-experimental/geo-proj/refs/tags/v1/schema.json",
-                        "spec_url": "https://github.com/zarr-experimental/geo-proj/blob/v1/README.md",
-                        "name": "proj:",
-                        "description": "Coordinate reference system information for geospatial data",
-                    },
-                ],
+                **common_attrs,
                 "long_name": f"BOA reflectance from MSI acquisition at spectral band {name}",
-                "units": "digital_counts",
-                "scale_factor": scale_factor,
-                "add_offset": offset,
-                "valid_min": 1,
-                "valid_max": 65535,
-                "fill_value": 0,
-                "proj:code": f"EPSG:{crs.to_epsg()}",
-                "spatial:dimensions": ["y", "x"],
-                "spatial:transform": [
-                    x_coords[1] - x_coords[0],
-                    0.0,
-                    x_coords[0],
-                    0.0,
-                    y_coords[1] - y_coords[0],
-                    y_coords[0],
-                ],
-                "spatial:shape": [height, width],
-                "spatial:bbox": [x_coords[0], y_coords[-1], x_coords[-1], y_coords[0]],
-                "spatial:registration": "pixel",
             },
         )
 
@@ -366,174 +360,89 @@ def create_geozarr_fixture(  # noqa: C901
         )
         return {"x": x_da, "y": y_da}
 
-    # Level 0 (10m): Only native 10m bands
-    print("Creating Level 0 (10m) with bands: b02, b03, b04, b08")
-
-    coords = create_coord_arrays(base_x_10m, base_y_10m)
-
-    create_data_array = (
-        create_data_array_v0 if version == "v0" else create_data_array_v1
+    create_level_attrs = (
+        create_level_attrs_v0 if version == "v0" else create_level_attrs_v1
     )
 
-    # Native 10m bands
-    bands_10m = {}
-    for band in ["b02", "b03", "b04", "b08"]:
-        bands_10m[band] = create_data_array(
-            band, base_x_10m, base_y_10m, with_time=with_time
+    level_datasets: list[tuple[xr.Dataset, str, dict]] = []
+    for level, (x_coords, y_coords, name, resolution, bands) in enumerate(levels):
+        print(f"Creating Level {level} ({resolution}m) with bands: {', '.join(bands)}")
+
+        # Every band of a level shares the same spatial metadata
+        x0, x1 = float(x_coords[0]), float(x_coords[-1])
+        y0, y1 = float(y_coords[0]), float(y_coords[-1])
+        dx = float(x_coords[1]) - x0
+        dy = float(y_coords[1]) - y0
+        common_attrs = create_level_attrs(
+            transform=[dx, 0.0, x0, 0.0, dy, y0],
+            bbox=[x0, y1, x1, y0],
+            shape=[len(y_coords), len(x_coords)],
         )
+        # Seeded per fixture and level, so the data does not depend on what
+        # was generated before
+        rng = np.random.default_rng([int(version == "v1"), int(with_time), level])
+        data_arrays = {
+            band: create_data_array(
+                band, x_coords, y_coords, common_attrs, rng, with_time=with_time
+            )
+            for band in bands
+        }
+        ds = xr.Dataset({**data_arrays, **create_coord_arrays(x_coords, y_coords)})
 
-    # Create level 0 dataset
-    level_0_ds = xr.Dataset({**bands_10m, **coords})
-
-    # Set CRS at dataset level
-    level_0_ds = level_0_ds.rio.write_crs(crs)
-    level_0_ds = level_0_ds.rio.set_spatial_dims(x_dim="x", y_dim="y")
-
-    # Set grid_mapping attributes
-    level_0_ds.attrs["grid_mapping"] = "spatial_ref"
-    for var in ["b02", "b03", "b04", "b08"]:
-        level_0_ds[var].attrs["grid_mapping"] = "spatial_ref"
-
-    if version == "v0":
-        level_0_ds.attrs["pyramid_level"] = 0
-        level_0_ds.attrs["resolution_meters"] = 10
-        group_name = "0"
-    else:
-        group_name = "r10m"
-
-    # Create encoding and write level 0
-    encoding_0 = create_encoding(level_0_ds)
-    level_0_ds.to_zarr(
-        fixture_path,
-        group=f"measurements/reflectance/{group_name}",
-        mode="w",
-        consolidated=True,
-        zarr_format=3,
-        encoding=encoding_0,
-    )
-
-    # Level 1 (20m): All bands (native 20m + downsampled 10m)
-    print("Creating Level 1 (20m) with all bands")
-
-    coords = create_coord_arrays(base_x_20m, base_y_20m)
-
-    # All bands at 20m resolution
-    bands_20m = {}
-    for band in ["b02", "b03", "b04", "b05", "b06", "b07", "b08", "b11", "b12", "b8a"]:
-        bands_20m[band] = create_data_array(
-            band, base_x_20m, base_y_20m, with_time=with_time
-        )
-
-    level_1_ds = xr.Dataset({**bands_20m, **coords})
-
-    # Set CRS at dataset level
-    level_1_ds = level_1_ds.rio.write_crs(crs)
-    level_1_ds = level_1_ds.rio.set_spatial_dims(x_dim="x", y_dim="y")
-
-    # Set grid_mapping attributes
-    level_1_ds.attrs["grid_mapping"] = "spatial_ref"
-    for var in ["b02", "b03", "b04", "b05", "b06", "b07", "b08", "b11", "b12", "b8a"]:
-        level_1_ds[var].attrs["grid_mapping"] = "spatial_ref"
-
-    if version == "v0":
-        level_1_ds.attrs["pyramid_level"] = 1
-        level_1_ds.attrs["resolution_meters"] = 20
-        group_name = "1"
-    else:
-        group_name = "r20m"
-
-    # Create encoding and write level 1
-    encoding_1 = create_encoding(level_1_ds)
-    level_1_ds.to_zarr(
-        fixture_path,
-        group=f"measurements/reflectance/{group_name}",
-        mode="a",
-        consolidated=True,
-        zarr_format=3,
-        encoding=encoding_1,
-    )
+        # Set CRS at dataset level
+        ds = ds.rio.write_crs(crs)
+        ds = ds.rio.set_spatial_dims(x_dim="x", y_dim="y")
 
-    # Level 2 (60m): All bands
-    print("Creating Level 2 (60m) with all bands")
+        # Set grid_mapping attributes
+        ds.attrs["grid_mapping"] = "spatial_ref"
+        for band in bands:
+            ds[band].attrs["grid_mapping"] = "spatial_ref"
 
-    coords = create_coord_arrays(base_x_60m, base_y_60m)
+        if version == "v0":
+            ds.attrs.update({"pyramid_level": level, "resolution_meters": resolution})
+            group_name = str(level)
+        else:
+            group_name = name
 
-    # All bands at 60m resolution
-    bands_60m = {}
-    for band in ["b02", "b03", "b04", "b05", "b06", "b07", "b08", "b11", "b12", "b8a"]:
-        bands_60m[band] = create_data_array(
-            band, base_x_60m, base_y_60m, with_time=with_time
+        level_datasets.append(
+            (ds, f"measurements/reflectance/{group_name}", create_encoding(ds))
         )
 
-    level_2_ds = xr.Dataset({**bands_60m, **coords})
-
-    # Set CRS at dataset level
-    level_2_ds = level_2_ds.rio.write_crs(crs)
-    level_2_ds = level_2_ds.rio.set_spatial_dims(x_dim="x", y_dim="y")
-
-    # Set grid_mapping attributes
-    level_2_ds.attrs["grid_mapping"] = "spatial_ref"
-    for var in ["b02", "b03", "b04", "b05", "b06", "b07", "b08", "b11", "b12", "b8a"]:
-        level_2_ds[var].attrs["grid_mapping"] = "spatial_ref"
-
-    if version == "v0":
-        level_2_ds.attrs["pyramid_level"] = 2
-        level_2_ds.attrs["resolution_meters"] = 60
-        group_name = "2"
-    else:
-        group_name = "r60m"
-
-    # Create encoding and write level 2
-    encoding_2 = create_encoding(level_2_ds)
-    level_2_ds.to_zarr(
+    # Write level 0 first to initialize the store
+    ds, group, encoding = level_datasets[0]
+    ds.to_zarr(
         fixture_path,
-        group=f"measurements/reflectance/{group_name}",
-        mode="a",
-        consolidated=True,
+        group=group,
+        mode="w",
+        consolidated=False,
         zarr_format=3,
-        encoding=encoding_2,
+        encoding=encoding,
     )
 
-    # Level 3 (120m): All bands (downsampled from level 2)
-    print("Creating Level 3 (120m) with all bands")
-
-    coords = create_coord_arrays(base_x_120m, base_y_120m)
-
-    # All bands at 120m resolution
-    bands_120m = {}
-    for band in ["b02", "b03", "b04", "b05", "b06", "b07", "b08", "b11", "b12", "b8a"]:
-        bands_120m[band] = create_data_array(
-            band, base_x_120m, base_y_120m, with_time=with_time
+    # Levels 1-3 write to disjoint groups so they can be written concurrently
+    pending_levels = level_datasets[1:]
+
+    def write_level(ds: xr.Dataset, group: str, encoding: dict) -> None:
+        """Append a pyramid level to the store."""
+        ds.to_zarr(
+            fixture_path,
+            group=group,
+            mode="a",
+            consolidated=False,
+            zarr_format=3,
+            encoding=encoding,
         )
 
-    level_3_ds = xr.Dataset({**bands_120m, **coords})
-
-    # Set CRS at dataset level
-    level_3_ds = level_3_ds.rio.write_crs(crs)
-    level_3_ds = level_3_ds.rio.set_spatial_dims(x_dim="x", y_dim="y")
+    # Blosc releases the GIL while compressing, so threads overlap the writes
+    with ThreadPoolExecutor(max_workers=len(pending_levels)) as executor:
+        futures = [executor.submit(write_level, *level) for level in pending_levels]
+        for future in futures:
+            future.result()
 
-    # Set grid_mapping attributes
-    level_3_ds.attrs["grid_mapping"] = "spatial_ref"
-    for var in ["b02", "b03", "b04", "b05", "b06", "b07", "b08", "b11", "b12", "b8a"]:
-        level_3_ds[var].attrs["grid_mapping"] = "spatial_ref"
+    # Mark the store as complete, then consolidate once every group is written
+    store.attrs["_fixture_hash"] = fixture_hash
+    zarr.consolidate_metadata(fixture_path)
 
-    if version == "v0":
-        level_3_ds.attrs["pyramid_level"] = 3
-        level_3_ds.attrs["resolution_meters"] = 120
-        group_name = "3"
-    else:
-        group_name = "r120m"
-
-    # Create encoding and write level 3
-    encoding_3 = create_encoding(level_3_ds)
-    level_3_ds.to_zarr(
-        fixture_path,
-        group=f"measurements/reflectance/{group_name}",
-        mode="a",
-        consolidated=True,
-        zarr_format=3,
-        encoding=encoding_3,
-    )
     print(f"✅ Created GeoZarr ({version}) fixture at {fixture_path}")
     print("Structure:")
     print("  - Level 0 (10m): b02, b03, b04, b08 only")
@@ -546,6 +455,11 @@ def create_geozarr_fixture(  # noqa: C901
 
 def create_zarr_with_scale_offset(path: str) -> None:
     """Create a zarr archive."""
+    import zarr
+    from affine import Affine
+    from xarray.backends.zarr import FillValueCoder
+    from zarr.codecs import CastValue, ScaleOffset
+
     arr = np.random.rand(1800, 3600)
     arr = np.expand_dims(arr, axis=0)  # create 3d array
     arr = np.repeat(arr, 2, axis=0)
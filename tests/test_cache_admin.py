@@ -0,0 +1,153 @@
+"""Tests for the cache administration endpoints."""
+
+import fnmatch
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from pydantic import ValidationError
+from starlette.testclient import TestClient
+
+from titiler.cache.admin import (
+    CacheStats,
+    InvalidateResponse,
+    create_cache_admin_router,
+)
+from titiler.cache.backends import CacheBackend
+from titiler.cache.utils import CacheKeyGenerator
+
+
+class MemoryBackend(CacheBackend):
+    """In-memory backend, failing to clear the `broken:*` pattern."""
+
+    def __init__(self):
+        """Set up the storage."""
+        self.storage: dict[str, bytes] = {}
+        self.stats_calls = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a value."""
+        return self.storage.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> bool:
+        """Set a value."""
+        self.storage[key] = value
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key."""
+        return self.storage.pop(key, None) is not None
+
+    async def exists(self, key: str) -> bool:
+        """Check a key exists."""
+        return key in self.storage
+
+    async def clear_pattern(self, pattern) -> int:
+        """Delete the keys matching a glob pattern."""
+        if pattern.startswith("broken:"):
+            raise RuntimeError("backend error")
+
+        return await self.delete_many(
+            [key for key in self.storage if fnmatch.fnmatch(key, pattern)]
+        )
+
+    async def health_check(self) -> dict:
+        """Health check."""
+        return {"status": "healthy"}
+
+    async def get_stats(self) -> dict:
+        """Backend statistics."""
+        self.stats_calls += 1
+        return {"total_keys": len(self.storage), "hit_rate": 0.5}
+
+
+@pytest.fixture
+def backend():
+    """Backend with a few cached entries."""
+    backend = MemoryBackend()
+    backend.storage = {
+        "test:tile:a:1": b"",
+        "test:tile:a:2": b"",
+        "test:tile:b:1": b"",
+        "test:info:a": b"",
+    }
+    return backend
+
+
+@pytest.fixture
+def client(backend):
+    """Application exposing the cache admin endpoints."""
+    app = FastAPI()
+    app.include_router(create_cache_admin_router(backend, CacheKeyGenerator("test")))
+    with TestClient(app) as client:
+        yield client
+
+
+def test_cache_status(client, backend):
+    """Test the cache status endpoint."""
+    response = client.get("/admin/cache/status")
+    assert response.status_code == 200
+    assert response.json() == {
+        "backend_type": "memory",
+        "namespace": "test",
+        "total_keys": 4,
+        "cache_size_bytes": None,
+        "hit_rate": 0.5,
+        "uptime_seconds": None,
+    }
+
+    # Statistics are fetched on every request
+    del backend.storage["test:info:a"]
+    assert client.get("/admin/cache/status").json()["total_keys"] == 3
+    assert backend.stats_calls == 2
+
+
+def test_cache_invalidate(client, backend):
+    """Test the cache invalidation endpoint."""
+    response = client.post(
+        "/admin/cache/invalidate",
+        json={"patterns": ["test:tile:a:*", "test:info:*", "test:missing:*"]},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"]
+    assert body["invalidated_count"] == 3
+    assert body["failed_patterns"] == []
+    assert body["execution_time_ms"] >= 0
+    assert list(backend.storage) == ["test:tile:b:1"]
+
+
+def test_cache_invalidate_partial_failure(client, backend):
+    """Test failing patterns are reported without stopping the others."""
+    response = client.post(
+        "/admin/cache/invalidate",
+        json={"patterns": ["broken:*", "test:tile:*", "broken:again:*"]},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert not body["success"]
+    assert body["invalidated_count"] == 3
+    assert body["failed_patterns"] == ["broken:*", "broken:again:*"]
+    assert list(backend.storage) == ["test:info:a"]
+
+
+def test_cache_admin_unavailable():
+    """Test the router without cache backend."""
+    app = FastAPI()
+    app.include_router(create_cache_admin_router(None, None))
+    with TestClient(app) as client:
+        assert client.get("/admin/cache/status").status_code == 503
+        assert client.post("/admin/cache/invalidate", json={}).status_code == 404
+
+
+def test_cache_admin_models_frozen():
+    """Test the admin models are immutable."""
+    response = InvalidateResponse(
+        success=True, invalidated_count=1, failed_patterns=[], execution_time_ms=0.1
+    )
+    with pytest.raises(ValidationError):
+        response.success = False
+
+    stats = CacheStats(backend_type="memory", namespace="test")
+    with pytest.raises(ValidationError):
+        stats.total_keys = 1
@@ -0,0 +1,158 @@
+"""Tests for cache backends."""
+
+import fnmatch
+import logging
+from typing import Optional
+
+import pytest
+
+from titiler.cache.backends import CacheBackend, RedisCacheBackend, S3StorageBackend
+from titiler.cache.backends import base as base_backend
+from titiler.cache.backends import redis as redis_backend
+
+CACHE_KEYS = (
+    "ns:tile:collections:a:items:b:10:512:384:noparams",
+    "ns:tile:collections:a:items:c:10:512:384:0f3a9b2c",
+    "ns:tilejson:collections:a:items:b:noparams",
+    "ns:info:collections:b:items:b:noparams",
+    "ns:tile:[x]:noparams",
+    "ns:tile:",
+    "other:tile:collections:a:items:b:noparams",
+)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        # Prefix fast path
+        "ns:tile:*",
+        "ns:*",
+        "*",
+        # Not a plain prefix: `*` not trailing, `?`, `[...]` classes
+        "ns:*:collections:a:items:b:*",
+        "ns:tile:collections:a:items:?:*",
+        "ns:t?le*",
+        "ns:[ti]*",
+        "ns:[!t]*",
+        "ns:tile:[[]x]*",
+        "ns:tile:[*",
+        "*noparams",
+        # No wildcard at all
+        "ns:tile:",
+        "ns:tile",
+    ],
+)
+def test_s3_glob_matcher(pattern):
+    """Test the S3 glob matcher agrees with fnmatch."""
+    matches = S3StorageBackend._glob_matcher(pattern)
+    for key in CACHE_KEYS:
+        assert bool(matches(key)) == fnmatch.fnmatch(key, pattern), key
+
+
+class FailingDeleteBackend(CacheBackend):
+    """In-memory backend whose `delete` fails for some keys."""
+
+    def __init__(self, keys, failing):
+        """Set up the stored keys and the keys failing to delete."""
+        self.storage = dict.fromkeys(keys, b"")
+        self.failing = set(failing)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a value."""
+        return self.storage.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> bool:
+        """Set a value."""
+        self.storage[key] = value
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key, raising for the failing ones."""
+        if key in self.failing:
+            raise RuntimeError(f"cannot delete {key}")
+        return self.storage.pop(key, None) is not None
+
+    async def exists(self, key: str) -> bool:
+        """Check a key exists."""
+        return key in self.storage
+
+    async def clear_pattern(self, pattern) -> int:
+        """Delete the keys matching a glob pattern."""
+        return await self.delete_many(
+            [key for key in self.storage if fnmatch.fnmatch(key, pattern)]
+        )
+
+    async def health_check(self) -> dict:
+        """Health check."""
+        return {"status": "healthy"}
+
+    async def close(self) -> None:
+        """Close the backend."""
+
+
+@pytest.mark.asyncio
+async def test_base_delete_many(monkeypatch, caplog):
+    """Test the default delete_many only counts successful deletions."""
+    monkeypatch.setattr(base_backend, "DELETE_CONCURRENCY", 2)
+
+    backend = FailingDeleteBackend(CACHE_KEYS, failing=[CACHE_KEYS[1]])
+    with caplog.at_level(logging.ERROR, logger=base_backend.__name__):
+        deleted = await backend.delete_many([*CACHE_KEYS[:4], "ns:missing"])
+
+    # One key failed and one did not exist
+    assert deleted == 3
+    assert [record.getMessage() for record in caplog.records] == [
+        f"Failed to delete cache key {CACHE_KEYS[1]}: cannot delete {CACHE_KEYS[1]}"
+    ]
+    assert set(backend.storage) == {CACHE_KEYS[1], *CACHE_KEYS[4:]}
+
+    assert await backend.delete_many([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_delete_many(redis_host, monkeypatch):
+    """Test Redis delete_many unlinks keys in batches."""
+    monkeypatch.setattr(redis_backend, "DELETE_BATCH_SIZE", 2)
+
+    backend = RedisCacheBackend(host=redis_host)
+    keys = [f"test-delete-many:{key}" for key in CACHE_KEYS]
+    for key in keys:
+        await backend.set(key, b"data")
+
+    assert await backend.delete_many([*keys[:5], "test-delete-many:missing"]) == 5
+    assert not await backend.exists(keys[0])
+    assert await backend.exists(keys[5])
+
+    assert await backend.delete_many(keys) == 2
+    assert await backend.delete_many([]) == 0
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_clear_pattern(redis_host, monkeypatch):
+    """Test Redis clear_pattern deletes the matching keys, batch by batch."""
+    monkeypatch.setattr(redis_backend, "DELETE_BATCH_SIZE", 2)
+
+    backend = RedisCacheBackend(host=redis_host)
+    keys = [f"test-clear-pattern:{key}" for key in CACHE_KEYS]
+    for key in keys:
+        await backend.set(key, b"data")
+
+    batches = []
+    delete_many = backend.delete_many
+
+    async def record_delete_many(batch):
+        batches.append(len(batch))
+        return await delete_many(batch)
+
+    monkeypatch.setattr(backend, "delete_many", record_delete_many)
+
+    # 5 keys under `ns:tile:*` / `ns:tilejson:*`
+    assert await backend.clear_pattern("test-clear-pattern:ns:tile*") == 5
+    assert batches == [2, 2, 1]
+    for key in keys:
+        assert await backend.exists(key) == (":ns:tile" not in key)
+
+    assert await backend.clear_pattern("test-clear-pattern:*") == 2
+    assert await backend.clear_pattern("test-clear-pattern:*") == 0
+    await backend.close()
@@ -1,9 +1,10 @@
 """Tests for cache key generation utilities."""
 
+import pytest
 from fastapi import FastAPI
 from starlette.testclient import TestClient
 
-from titiler.cache.utils import CacheKeyGenerator
+from titiler.cache.utils import CacheKeyGenerator, get_generator
 
 
 class TestCacheKeyGenerator:
@@ -22,6 +23,17 @@ class TestCacheKeyGenerator:
         assert generator.exclude_params == {"format", "buffer"}
         assert generator.max_key_length == 100
 
+    def test_get_generator(self):
+        """Test shared CacheKeyGenerator factory."""
+        generator = get_generator("test-app", ("format",), 100)
+        assert isinstance(generator, CacheKeyGenerator)
+        assert generator.exclude_params == {"format"}
+        assert generator.max_key_length == 100
+
+        # Identical configurations share one instance
+        assert get_generator("test-app", ("format",), 100) is generator
+        assert get_generator("test-app") is not generator
+
     def test_path_parsing(self):
         """Test URL path parsing."""
         generator = CacheKeyGenerator("test")
@@ -45,6 +57,15 @@ class TestCacheKeyGenerator:
         ]
         assert generator._parse_path("/tilejson.json") == ["tilejson"]
 
+        # Only one alphanumeric extension (up to 8 characters) is removed
+        assert generator._parse_path("/a/b.tar.gz") == ["a", "b.tar"]
+        assert generator._parse_path("/a/384@1x.png") == ["a", "384@1x"]
+        assert generator._parse_path("/a/b.c-d") == ["a", "b.c-d"]
+        assert generator._parse_path("/a/file.") == ["a", "file."]
+        assert generator._parse_path("/a/.hidden") == ["a", ".hidden"]
+        assert generator._parse_path("/a/b.abcdefgh") == ["a", "b"]
+        assert generator._parse_path("/a/b.abcdefghi") == ["a", "b.abcdefghi"]
+
         # Test complex paths
         path = "/collections/test/items/item1/tiles/WebMercatorQuad/10/512/384.png"
         expected = [
@@ -78,6 +99,18 @@ class TestCacheKeyGenerator:
         filtered = generator._filter_query_params(params)
         assert filtered == {"rescale": "0,255"}
 
+        # Test per-call exclusions, the generator's own are read-only
+        assert generator._filter_query_params(params, ["RESCALE"]) == {}
+        assert generator.exclude_params == {"format", "buffer"}
+        with pytest.raises(AttributeError):
+            generator.exclude_params = {"rescale"}
+
+        # Test Unicode case-insensitive exclusion (casefold, not lower)
+        generator = CacheKeyGenerator("test", exclude_params=["straße"])
+        params = {"STRASSE": "1", "rescale": "0,255"}
+        filtered = generator._filter_query_params(params)
+        assert filtered == {"rescale": "0,255"}
+
     def test_params_hash_generation(self):
         """Test parameter hash generation."""
         generator = CacheKeyGenerator("test")
@@ -93,6 +126,13 @@ class TestCacheKeyGenerator:
         assert hash1 == hash2  # Should be identical despite different order
         assert len(hash1) == 8  # Should be 8 characters
 
+        # Separators inside keys or values cannot make parameters collide
+        # (e.g. `?colormap_name%1Frescale=viridis%1F0,255`)
+        injected = {"colormap_name\x1frescale": "viridis\x1f0,255"}
+        assert generator._generate_params_hash(injected) != hash1
+        injected = {"colormap_name": "viridis&rescale=0,255"}
+        assert generator._generate_params_hash(injected) != hash1
+
     def test_cache_key_from_path_and_params(self):
         """Test cache key generation from path and parameters."""
         generator = CacheKeyGenerator("titiler-eopf", exclude_params=["format"])
@@ -134,27 +174,31 @@ class TestCacheKeyGenerator:
         assert len(key) <= 50
         assert key.startswith("test:tile:hash:")
 
-    def test_pattern_generation(self):
+    @pytest.mark.parametrize(
+        "method,args,expected",
+        [
+            (
+                "get_pattern_for_collection",
+                ("test-collection",),
+                "test-app:*:collections:test-collection:*",
+            ),
+            (
+                "get_pattern_for_item",
+                ("test-collection", "test-item"),
+                "test-app:*:collections:test-collection:items:test-item:*",
+            ),
+            ("get_pattern_for_cache_type", ("tile",), "test-app:tile:*"),
+        ],
+    )
+    def test_pattern_generation(self, key_generator, method, args, expected):
         """Test Redis pattern generation."""
-        generator = CacheKeyGenerator("titiler-eopf")
-
-        # Test collection pattern
-        pattern = generator.get_pattern_for_collection("test-collection")
-        assert pattern == "titiler-eopf:*:collections:test-collection:*"
-
-        # Test item pattern
-        pattern = generator.get_pattern_for_item("test-collection", "test-item")
-        assert pattern == "titiler-eopf:*:collections:test-collection:items:test-item:*"
-
-        # Test cache type pattern
-        pattern = generator.get_pattern_for_cache_type("tile")
-        assert pattern == "titiler-eopf:tile:*"
+        assert getattr(key_generator, method)(*args) == expected
 
 
 class TestRequestIntegration:
     """Test integration with HTTP requests."""
 
-    def test_request_key_generation(self):
+    def test_request_key_generation(self, key_generator):
         """Test cache key generation from actual requests."""
         app = FastAPI()
 
@@ -163,7 +207,6 @@ class TestRequestIntegration:
             return {"message": "test"}
 
         client = TestClient(app)
-        generator = CacheKeyGenerator("test-app")
 
         # Make a request to get request object
         with client:
@@ -187,7 +230,7 @@ class TestRequestIntegration:
                 self.query_params = query_params
 
         mock_request = MockRequest(url, query_params)
-        key = generator.from_request(mock_request, "tile")
+        key = key_generator.from_request(mock_request, "tile")
 
         # Verify key structure
         assert key.startswith("test-app:tile:")
@@ -196,9 +239,8 @@ class TestRequestIntegration:
         assert "items" in key
         assert "item1" in key
 
-    def test_extra_params_handling(self):
+    def test_extra_params_handling(self, key_generator):
         """Test handling of extra parameters in request-based key generation."""
-        generator = CacheKeyGenerator("test-app")
 
         # Create minimal mock request
         from starlette.datastructures import URL, QueryParams
@@ -214,13 +256,68 @@ class TestRequestIntegration:
 
         # Test with extra parameters
         extra_params = {"user_id": "123", "session": "abc"}
-        key = generator.from_request(mock_request, "tile", extra_params)
+        key = key_generator.from_request(mock_request, "tile", extra_params)
 
         # Key should be deterministic regardless of extra param order
         extra_params_reversed = {"session": "abc", "user_id": "123"}
-        key2 = generator.from_request(mock_request, "tile", extra_params_reversed)
+        key2 = key_generator.from_request(mock_request, "tile", extra_params_reversed)
         assert key == key2
 
+    def test_request_exclude_params(self):
+        """Test per-call parameter exclusion in request-based key generation."""
+        from starlette.datastructures import URL, QueryParams
+
+        class MockRequest:
+            def __init__(self, url, query_params):
+                self.url = url
+                self.query_params = query_params
+
+        generator = CacheKeyGenerator("test", exclude_params=["format"])
+        url = URL("http://testserver/collections/test/tilejson.json")
+        key = generator.from_request(
+            MockRequest(url, QueryParams("rescale=0,255")), "tilejson"
+        )
+
+        request = MockRequest(url, QueryParams("rescale=0,255&format=png&Callback=cb"))
+        assert (
+            generator.from_request(request, "tilejson", exclude_params=["callback"])
+            == key
+        )
+
+        # The generator's own exclusions are left untouched
+        assert generator.exclude_params == {"format"}
+        assert generator.from_request(request, "tilejson") != key
+
+    def test_request_path_parsed_once_per_scope(self, key_generator):
+        """Test the parsed request path is memoized on the request scope."""
+        from starlette.datastructures import URL, QueryParams
+
+        from titiler.cache.utils.keys import PATH_PARTS_SCOPE_KEY
+
+        class MockRequest:
+            def __init__(self, url, query_params):
+                self.url = url
+                self.query_params = query_params
+                self.scope = {}
+
+        mock_request = MockRequest(
+            URL("http://testserver/collections/test/tiles/10/512/384.png"),
+            QueryParams("rescale=0,255"),
+        )
+        key = key_generator.from_request(mock_request, "tile")
+        assert mock_request.scope[PATH_PARTS_SCOPE_KEY] == [
+            "collections",
+            "test",
+            "tiles",
+            "10",
+            "512",
+            "384",
+        ]
+
+        # The stored parts are reused instead of parsing the URL again
+        mock_request.url = URL("http://testserver/other")
+        assert key_generator.from_request(mock_request, "tile") == key
+
 
 class TestEOPFRealWorldKeys:
     """Test cache key generation with real-world EOPF Explorer URLs."""
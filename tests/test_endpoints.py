@@ -1,49 +1,34 @@
 """Test titiler.eopf.main.app."""
 
+import asyncio
+import io
 from urllib.parse import parse_qs
 
+import numpy as np
+import pytest
 from owslib.wmts import WebMapTileService
 
-from .conftest import parse_img
-
-
-def test_dataset(app, geozarr):
-    """Test /datasets routes."""
-    collection, item = geozarr
-    response = app.get(f"/collections/{collection}/items/{item}/dataset")
-    assert response.status_code == 200
-    assert "text/html" in response.headers["content-type"]
-
-    response = app.get(f"/collections/{collection}/items/{item}/dataset")
-    assert response.status_code == 200
-    assert "text/html" in response.headers["content-type"]
-
-    response = app.get(f"/collections/{collection}/items/{item}/dataset/groups")
-    assert response.status_code == 200
-    assert response.headers["content-type"] == "application/json"
-    assert response.json() == ["/measurements/reflectance"]
-
-    response = app.get(f"/collections/{collection}/items/{item}/dataset/keys")
-    assert response.status_code == 200
-    assert response.headers["content-type"] == "application/json"
-    assert response.json() == [
-        "/measurements/reflectance:b02",
-        "/measurements/reflectance:b03",
-        "/measurements/reflectance:b04",
-        "/measurements/reflectance:b05",
-        "/measurements/reflectance:b06",
-        "/measurements/reflectance:b07",
-        "/measurements/reflectance:b08",
-        "/measurements/reflectance:b11",
-        "/measurements/reflectance:b12",
-        "/measurements/reflectance:b8a",
-    ]
-
-    response = app.get(f"/collections/{collection}/items/{item}/dataset/dict")
-    assert response.status_code == 200
-    assert response.headers["content-type"] == "application/json"
-    if item == "geozarr_v0":
-        assert set(response.json()) == {
+from .conftest import parse_img_header
+
+EXPECTED_GROUPS = ("/measurements/reflectance",)
+
+EXPECTED_KEYS = (
+    "/measurements/reflectance:b02",
+    "/measurements/reflectance:b03",
+    "/measurements/reflectance:b04",
+    "/measurements/reflectance:b05",
+    "/measurements/reflectance:b06",
+    "/measurements/reflectance:b07",
+    "/measurements/reflectance:b08",
+    "/measurements/reflectance:b11",
+    "/measurements/reflectance:b12",
+    "/measurements/reflectance:b8a",
+)
+
+# `/dataset/dict` group paths, per GeoZarr fixture version
+EXPECTED_TREES = {
+    "geozarr_v0": frozenset(
+        {
             ".",
             "measurements",
             "measurements/reflectance",
@@ -52,8 +37,9 @@ def test_dataset(app, geozarr):
             "measurements/reflectance/2",
             "measurements/reflectance/3",
         }
-    else:
-        assert set(response.json()) == {
+    ),
+    "geozarr_v1": frozenset(
+        {
             ".",
             "measurements",
             "measurements/reflectance",
@@ -62,43 +48,74 @@ def test_dataset(app, geozarr):
             "measurements/reflectance/r60m",
             "measurements/reflectance/r120m",
         }
+    ),
+}
 
 
-def test_preview(app, geozarr):
-    """Test preview routes."""
+@pytest.mark.asyncio
+async def test_dataset(async_app, geozarr):
+    """Test /datasets routes."""
     collection, item = geozarr
-    response = app.get(
-        f"/collections/{collection}/items/{item}/preview.png",
-        params={"variables": "/measurements/reflectance:b02"},
+    url = f"/collections/{collection}/items/{item}/dataset"
+    html, html_again, groups, keys, tree = await asyncio.gather(
+        async_app.get(url),
+        async_app.get(url),
+        async_app.get(f"{url}/groups"),
+        async_app.get(f"{url}/keys"),
+        async_app.get(f"{url}/dict"),
     )
-    assert response.status_code == 200
-    assert response.headers["content-type"] == "image/png"
-    profile = parse_img(response.content)
-    assert profile["count"] == 2
-    assert profile["dtype"] == "uint8"
 
-    response = app.get(
-        f"/collections/{collection}/items/{item}/preview.png",
-        params={"variables": "/measurements/reflectance:b02"},
-    )
-    assert response.status_code == 200
-    assert response.headers["content-type"] == "image/png"
-    profile = parse_img(response.content)
-    assert profile["count"] == 2
-    assert profile["dtype"] == "uint8"
+    for response in (html, html_again):
+        assert response.status_code == 200
+        assert "text/html" in response.headers["content-type"]
 
-    response = app.get(
-        f"/collections/{collection}/items/{item}/preview.png",
-        params=(
-            ("variables", "/measurements/reflectance:b04"),
-            ("variables", "/measurements/reflectance:b03"),
-            ("variables", "/measurements/reflectance:b02"),
-            ("rescale", "0,1"),
+    assert groups.status_code == 200
+    assert groups.headers["content-type"] == "application/json"
+    assert tuple(groups.json()) == EXPECTED_GROUPS
+
+    assert keys.status_code == 200
+    assert keys.headers["content-type"] == "application/json"
+    assert tuple(keys.json()) == EXPECTED_KEYS
+
+    assert tree.status_code == 200
+    assert tree.headers["content-type"] == "application/json"
+    assert set(tree.json()) == EXPECTED_TREES[item]
+
+
+@pytest.mark.asyncio
+async def test_preview(async_app, geozarr):
+    """Test preview routes."""
+    collection, item = geozarr
+    url = f"/collections/{collection}/items/{item}/preview"
+    single, single_again, rgb = await asyncio.gather(
+        async_app.get(
+            f"{url}.npy", params={"variables": "/measurements/reflectance:b02"}
+        ),
+        async_app.get(
+            f"{url}.npy", params={"variables": "/measurements/reflectance:b02"}
+        ),
+        async_app.get(
+            f"{url}.png",
+            params=(
+                ("variables", "/measurements/reflectance:b04"),
+                ("variables", "/measurements/reflectance:b03"),
+                ("variables", "/measurements/reflectance:b02"),
+                ("rescale", "0,1"),
+            ),
         ),
     )
-    assert response.status_code == 200
-    assert response.headers["content-type"] == "image/png"
-    profile = parse_img(response.content)
+
+    # Raw array (no PNG encoding): data band + mask
+    for response in (single, single_again):
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-binary"
+        arr = np.load(io.BytesIO(response.content))
+        assert arr.shape[0] == 2
+        assert arr.dtype == np.float64
+
+    assert rgb.status_code == 200
+    assert rgb.headers["content-type"] == "image/png"
+    profile = parse_img_header(rgb.content)
     assert profile["count"] == 4
     assert profile["dtype"] == "uint8"
 
@@ -133,39 +150,17 @@ def test_dataset_3d(app, geozarr_3d):
     response = app.get(f"/collections/{collection}/items/{item}/dataset/groups")
     assert response.status_code == 200
     assert response.headers["content-type"] == "application/json"
-    assert response.json() == ["/measurements/reflectance"]
+    assert tuple(response.json()) == EXPECTED_GROUPS
 
     response = app.get(f"/collections/{collection}/items/{item}/dataset/keys")
     assert response.status_code == 200
     assert response.headers["content-type"] == "application/json"
-    assert response.json() == [
-        "/measurements/reflectance:b02",
-        "/measurements/reflectance:b03",
-        "/measurements/reflectance:b04",
-        "/measurements/reflectance:b05",
-        "/measurements/reflectance:b06",
-        "/measurements/reflectance:b07",
-        "/measurements/reflectance:b08",
-        "/measurements/reflectance:b11",
-        "/measurements/reflectance:b12",
-        "/measurements/reflectance:b8a",
-    ]
+    assert tuple(response.json()) == EXPECTED_KEYS
 
     response = app.get(f"/collections/{collection}/items/{item}/info")
     assert response.status_code == 200
     assert response.headers["content-type"] == "application/json"
-    assert list(response.json()) == [
-        "/measurements/reflectance:b02",
-        "/measurements/reflectance:b03",
-        "/measurements/reflectance:b04",
-        "/measurements/reflectance:b05",
-        "/measurements/reflectance:b06",
-        "/measurements/reflectance:b07",
-        "/measurements/reflectance:b08",
-        "/measurements/reflectance:b11",
-        "/measurements/reflectance:b12",
-        "/measurements/reflectance:b8a",
-    ]
+    assert tuple(response.json()) == EXPECTED_KEYS
     info = response.json()["/measurements/reflectance:b02"]
     assert len(info["band_descriptions"]) == 2
     assert info["band_descriptions"][0][0] == "b1"
@@ -3,6 +3,8 @@
 Tests for end-to-end cache functionality with EOPF-specific features.
 """
 
+from dataclasses import dataclass, field
+
 import pytest
 from starlette.applications import Starlette
 
@@ -10,6 +12,26 @@ from titiler.cache.middleware import TileCacheMiddleware
 from titiler.cache.utils import CacheKeyGenerator
 
 
+@dataclass(frozen=True, slots=True)
+class FakeURL:
+    """Request URL stub."""
+
+    path: str
+
+    def __str__(self):
+        """Full URL of the path."""
+        return f"http://localhost{self.path}"
+
+
+@dataclass(frozen=True, slots=True)
+class FakeRequest:
+    """Request stub exposing only what the key generator reads."""
+
+    url: FakeURL
+    method: str = "GET"
+    query_params: dict = field(default_factory=dict)
+
+
 class MockCacheBackend:
     """Mock cache backend for testing."""
 
@@ -72,17 +94,6 @@ class TestEOPFCacheIntegration:
         """Test cache key generation for EOPF-specific paths."""
         key_generator = CacheKeyGenerator("eopf-test")
 
-        # Mock request for EOPF tile path
-        class MockRequest:
-            def __init__(self, path):
-                self.method = "GET"
-                self.url = type(
-                    "URL",
-                    (),
-                    {"path": path, "__str__": lambda self: f"http://localhost{path}"},
-                )()
-                self.query_params = {}
-
         collection, item = geozarr
 
         # Test various EOPF-specific paths
@@ -92,9 +103,9 @@ class TestEOPFCacheIntegration:
             f"/collections/{collection}/items/{item}/tilejson.json",
             f"/collections/{collection}/items/{item}/info.json",
         ]
+        requests = [FakeRequest(FakeURL(path)) for path in eopf_paths]
 
-        for path in eopf_paths:
-            request = MockRequest(path)
+        for request in requests:
             cache_key = key_generator.from_request(request, "tile")
 
             # Verify cache key is generated and contains expected components
@@ -117,10 +128,7 @@ class TestEOPFCacheIntegration:
         )
 
         # Verify middleware is properly installed
-        assert any(
-            isinstance(middleware, type) and issubclass(middleware, TileCacheMiddleware)
-            for middleware in [m.cls for m in app.user_middleware]
-        )
+        assert TileCacheMiddleware in {m.cls for m in app.user_middleware}
 
     @pytest.mark.asyncio
     async def test_eopf_cache_backend_compatibility(self):
@@ -1,9 +1,11 @@
 """Test eopf openeo processes io module."""
 
-from unittest.mock import Mock, patch
+from dataclasses import dataclass, field
+from unittest.mock import Mock
 
 import numpy as np
 import pytest
+import xarray
 from openeo_pg_parser_networkx.pg_schema import BoundingBox
 from rasterio.errors import RasterioIOError
 from rio_tiler.models import ImageData
@@ -15,194 +17,182 @@ from titiler.eopf.openeo.stacapi import LoadCollection
 from titiler.openeo.processes.implementations.data_model import RasterStack
 
 
-class TestLoadZarr:
-    """Test load_zarr function."""
+@dataclass
+class FakeDA:
+    """Data array stub exposing only what load_zarr reads."""
 
-    def test_load_zarr_basic(self):
-        """Test basic load_zarr functionality."""
-        with patch(
-            "titiler.eopf.openeo.processes.implementations.io.GeoZarrReader"
-        ) as mock_reader_class:
-            mock_reader = Mock()
-            mock_reader.variables = [
-                "measurements/reflectance:b02",
-                "measurements/reflectance:b03",
-            ]
+    dims: tuple = ("y", "x")
+    coords: dict = field(default_factory=dict)
 
-            # Mock the data array for time extraction
-            mock_da = Mock()
-            mock_da.dims = ["time", "y", "x"]
-            mock_time_coord = Mock()
-            mock_time_coord.__iter__ = lambda x: iter(
-                [Mock(values="2020-01-01T00:00:00")]
-            )
-            mock_da.coords = {"time": mock_time_coord}
 
-            mock_reader._get_variable.return_value = mock_da
-            mock_reader_class.return_value = mock_reader
+@dataclass
+class FakeReader:
+    """GeoZarrReader stub exposing only what load_zarr reads."""
 
-            result = load_zarr("test.zarr")
+    variables: list = field(default_factory=lambda: ["measurements/reflectance:b02"])
+    da: FakeDA = field(default_factory=FakeDA)
 
-            assert isinstance(result, RasterStack)
-            mock_reader_class.assert_called_once_with("test.zarr")
+    def _get_variable(self, group, variable):
+        return self.da
 
-    def test_load_zarr_no_time_dimension(self):
-        """Test load_zarr with no time dimension."""
-        with patch(
-            "titiler.eopf.openeo.processes.implementations.io.GeoZarrReader"
-        ) as mock_reader_class:
-            mock_reader = Mock()
-            mock_reader.variables = ["measurements/reflectance:b02"]
 
-            # Mock data array without time dimension
-            mock_da = Mock()
-            mock_da.dims = ["y", "x"]
-            mock_da.coords = {}
+class FakeReaderClass:
+    """Stand-in for the GeoZarrReader class, returning `reader` when called."""
 
-            mock_reader._get_variable.return_value = mock_da
-            mock_reader_class.return_value = mock_reader
+    def __init__(self):
+        """Start with a minimal (no time) reader and no recorded calls."""
+        self.reader = FakeReader()
+        self.calls = []
 
-            result = load_zarr("test.zarr")
+    def __call__(self, input):
+        """Record the opened URL and return the stub reader."""
+        self.calls.append(input)
+        return self.reader
 
-            assert isinstance(result, RasterStack)
 
-    def test_load_zarr_with_spatial_extent(self):
-        """Test load_zarr with spatial extent."""
-        bbox = BoundingBox(west=-10, south=40, east=10, north=50)
+@pytest.fixture
+def fake_reader_cls(monkeypatch):
+    """Replace GeoZarrReader in the io module with a FakeReaderClass."""
+    fake_reader_cls = FakeReaderClass()
+    monkeypatch.setattr(
+        "titiler.eopf.openeo.processes.implementations.io.GeoZarrReader",
+        fake_reader_cls,
+    )
+    return fake_reader_cls
 
-        with patch(
-            "titiler.eopf.openeo.processes.implementations.io.GeoZarrReader"
-        ) as mock_reader_class:
-            mock_reader = Mock()
-            mock_reader.variables = ["measurements/reflectance:b02"]
-            mock_da = Mock()
-            mock_da.dims = ["y", "x"]
-            mock_reader._get_variable.return_value = mock_da
-            mock_reader_class.return_value = mock_reader
 
-            result = load_zarr("test.zarr", spatial_extent=bbox, width=512, height=512)
+@pytest.fixture
+def stac_reader_ctx(monkeypatch):
+    """Replace STACReader in the openEO reader module with a context manager mock.
 
-            assert isinstance(result, RasterStack)
+    Returns the mocked class and the reader instance its context yields.
+    """
+    mock_stac_reader = Mock()
+    mock_reader_instance = Mock()
+    mock_stac_reader.return_value.__enter__ = Mock(return_value=mock_reader_instance)
+    mock_stac_reader.return_value.__exit__ = Mock(return_value=None)
+    monkeypatch.setattr("titiler.eopf.openeo.reader.STACReader", mock_stac_reader)
+    return mock_stac_reader, mock_reader_instance
 
-    def test_load_zarr_with_options(self):
-        """Test load_zarr with custom options."""
-        options = {"variables": ["custom:variable"], "method": "bilinear"}
 
-        with patch(
-            "titiler.eopf.openeo.processes.implementations.io.GeoZarrReader"
-        ) as mock_reader_class:
-            mock_reader = Mock()
-            mock_reader.variables = ["custom:variable"]
-            mock_da = Mock()
-            mock_da.dims = ["y", "x"]
-            mock_reader._get_variable.return_value = mock_da
-            mock_reader_class.return_value = mock_reader
+@pytest.fixture(scope="module")
+def mock_img():
+    """ImageData returned by the mocked STACReader, shared by the _reader tests."""
+    return ImageData(
+        array=np.ones((3, 256, 256), dtype=np.uint8),
+        crs="EPSG:4326",
+        bounds=(0, 0, 1, 1),
+    )
 
-            result = load_zarr("test.zarr", options=options)
 
-            assert isinstance(result, RasterStack)
+class TestLoadZarr:
+    """Test load_zarr function."""
 
+    def test_load_zarr_basic(self, fake_reader_cls):
+        """Test basic load_zarr functionality."""
+        # Data array with a time dimension, for time extraction
+        time_coord = xarray.DataArray(
+            np.array(["2020-01-01"], dtype="datetime64[ns]"), dims="time"
+        )
+        fake_reader_cls.reader = FakeReader(
+            variables=[
+                "measurements/reflectance:b02",
+                "measurements/reflectance:b03",
+            ],
+            da=FakeDA(dims=("time", "y", "x"), coords={"time": time_coord}),
+        )
 
-class TestSTACReaderMethods:
-    """Test specific methods of STACReader without full initialization."""
+        result = load_zarr("test.zarr")
 
-    def test_get_reader_zarr_detection(self):
-        """Test _get_reader method correctly identifies Zarr assets."""
-        from titiler.eopf.reader import GeoZarrReader
+        assert isinstance(result, RasterStack)
+        assert fake_reader_cls.calls == ["test.zarr"]
 
-        # Create a minimal STACReader instance by mocking the initialization
-        with patch("titiler.eopf.openeo.reader.SimpleSTACReader.__attrs_post_init__"):
-            mock_item = Mock()
-            mock_item.bbox = [0, 0, 1, 1]
-            reader = STACReader(mock_item)
+    def test_load_zarr_no_time_dimension(self, fake_reader_cls):
+        """Test load_zarr with no time dimension."""
+        result = load_zarr("test.zarr")
 
-            # Test Zarr asset detection
-            asset_info = {"media_type": "application/x-zarr", "url": "test.zarr"}
-            reader_class = reader._get_reader(asset_info)
-            assert reader_class == GeoZarrReader
+        assert isinstance(result, RasterStack)
 
-            # Test non-Zarr asset
-            asset_info = {"media_type": "image/tiff", "url": "test.tif"}
-            reader_class = reader._get_reader(asset_info)
-            assert reader_class != GeoZarrReader
+    def test_load_zarr_with_spatial_extent(self, fake_reader_cls):
+        """Test load_zarr with spatial extent."""
+        bbox = BoundingBox(west=-10, south=40, east=10, north=50)
 
+        result = load_zarr("test.zarr", spatial_extent=bbox, width=512, height=512)
 
-class TestReader:
-    """Test _reader function."""
+        assert isinstance(result, RasterStack)
 
-    def test_reader_success(self):
-        """Test _reader function successful execution."""
-        mock_item = {"id": "test_item"}
-        bbox = [0, 0, 1, 1]
+    def test_load_zarr_with_options(self, fake_reader_cls):
+        """Test load_zarr with custom options."""
+        options = {"variables": ["custom:variable"], "method": "bilinear"}
+        fake_reader_cls.reader = FakeReader(variables=["custom:variable"])
 
-        mock_img = ImageData(
-            array=np.ones((3, 256, 256), dtype=np.uint8), crs="EPSG:4326", bounds=bbox
-        )
+        result = load_zarr("test.zarr", options=options)
 
-        with patch("titiler.eopf.openeo.reader.STACReader") as mock_stac_reader:
-            mock_reader_instance = Mock()
-            mock_reader_instance.part.return_value = mock_img
-            mock_stac_reader.return_value.__enter__ = Mock(
-                return_value=mock_reader_instance
-            )
-            mock_stac_reader.return_value.__exit__ = Mock(return_value=None)
+        assert isinstance(result, RasterStack)
 
-            result = _reader(mock_item, bbox)
 
-            assert isinstance(result, ImageData)
-            mock_reader_instance.part.assert_called_once_with(bbox)
+class TestSTACReaderMethods:
+    """Test specific methods of STACReader without full initialization."""
 
-    def test_reader_retry_logic(self):
-        """Test _reader function retry logic."""
-        mock_item = {"id": "test_item"}
-        bbox = [0, 0, 1, 1]
+    def test_get_reader_zarr_detection(self, monkeypatch):
+        """Test _get_reader method correctly identifies Zarr assets."""
+        from titiler.eopf.reader import GeoZarrReader
 
-        with (
-            patch("titiler.eopf.openeo.reader.STACReader") as mock_stac_reader,
-            patch("time.sleep"),
-            patch("builtins.print"),
-        ):  # Suppress print statements
-            mock_reader_instance = Mock()
-            # First two calls fail, third succeeds
-            mock_reader_instance.part.side_effect = [
-                RasterioIOError("Network error"),
-                RasterioIOError("Network error"),
-                ImageData(array=np.ones((3, 256, 256)), crs="EPSG:4326", bounds=bbox),
-            ]
+        # Create a minimal STACReader instance by skipping the initialization
+        monkeypatch.setattr(
+            "titiler.eopf.openeo.reader.SimpleSTACReader.__attrs_post_init__",
+            lambda self: None,
+        )
+        mock_item = Mock()
+        mock_item.bbox = [0, 0, 1, 1]
+        reader = STACReader(mock_item)
 
-            mock_stac_reader.return_value.__enter__ = Mock(
-                return_value=mock_reader_instance
-            )
-            mock_stac_reader.return_value.__exit__ = Mock(return_value=None)
+        # Test Zarr asset detection
+        asset_info = {"media_type": "application/x-zarr", "url": "test.zarr"}
+        reader_class = reader._get_reader(asset_info)
+        assert reader_class == GeoZarrReader
 
-            result = _reader(mock_item, bbox)
+        # Test non-Zarr asset
+        asset_info = {"media_type": "image/tiff", "url": "test.tif"}
+        reader_class = reader._get_reader(asset_info)
+        assert reader_class != GeoZarrReader
 
-            assert isinstance(result, ImageData)
-            assert mock_reader_instance.part.call_count == 3
 
-    def test_reader_max_retries_exceeded(self):
-        """Test _reader function when max retries are exceeded."""
+class TestReader:
+    """Test _reader function."""
+
+    @pytest.mark.parametrize(
+        "outcomes,raises",
+        [
+            # Successful read
+            (["image"], False),
+            # First two calls fail, third succeeds
+            (["error", "error", "image"], False),
+            # Always fail, until max retries are exceeded
+            (["error"] * 10, True),
+        ],
+        ids=["success", "retry", "max_retries_exceeded"],
+    )
+    def test_reader(self, stac_reader_ctx, mock_img, outcomes, raises):
+        """Test _reader function, including its retry logic."""
         mock_item = {"id": "test_item"}
         bbox = [0, 0, 1, 1]
 
-        with (
-            patch("titiler.eopf.openeo.reader.STACReader") as mock_stac_reader,
-            patch("time.sleep"),
-            patch("builtins.print"),
-        ):  # Suppress print statements
-            mock_reader_instance = Mock()
-            # Always fail
-            mock_reader_instance.part.side_effect = RasterioIOError(
-                "Persistent network error"
-            )
-
-            mock_stac_reader.return_value.__enter__ = Mock(
-                return_value=mock_reader_instance
-            )
-            mock_stac_reader.return_value.__exit__ = Mock(return_value=None)
+        _, mock_reader_instance = stac_reader_ctx
+        network_error = RasterioIOError("Network error")
+        mock_reader_instance.part.side_effect = [
+            mock_img if outcome == "image" else network_error for outcome in outcomes
+        ]
 
+        if raises:
             with pytest.raises(RasterioIOError):
                 _reader(mock_item, bbox)
+        else:
+            result = _reader(mock_item, bbox)
+            assert result is mock_img
+
+        assert mock_reader_instance.part.call_count == len(outcomes)
+        mock_reader_instance.part.assert_called_with(bbox)
 
 
 class TestLoadCollectionBasic:
@@ -240,30 +230,23 @@ class TestLoggerUsage:
 class TestExceptionHandling:
     """Test the improved exception handling."""
 
-    def test_rasterio_import(self):
+    def test_rasterio_import(self, monkeypatch):
         """Test that rasterio.RasterioIOError can be imported and used."""
-        with patch("titiler.eopf.openeo.reader.STACReader"):
-            # This should not raise any import errors
-            from titiler.eopf.openeo.reader import STACReader
+        monkeypatch.setattr("titiler.eopf.openeo.reader.STACReader", Mock())
 
-            assert STACReader is not None
+        # This should not raise any import errors
+        from titiler.eopf.openeo.reader import STACReader
 
-    def test_nodata_in_bounds_import(self):
+        assert STACReader is not None
+
+    def test_nodata_in_bounds_import(self, fake_reader_cls):
         """Test that NoDataInBounds can be imported and used."""
         assert NoDataInBounds is not None
 
         # Test that it's used in the allowed_exceptions
-        with patch(
-            "titiler.eopf.openeo.processes.implementations.io.GeoZarrReader"
-        ) as mock_reader_class:
-            mock_reader = Mock()
-            mock_reader.variables = ["test"]
-            mock_da = Mock()
-            mock_da.dims = ["y", "x"]
-            mock_reader._get_variable.return_value = mock_da
-            mock_reader_class.return_value = mock_reader
-
-            result = load_zarr("test.zarr")
-
-            # Check that the RasterStack was created with the correct exceptions
-            assert isinstance(result, RasterStack)
+        fake_reader_cls.reader = FakeReader(variables=["test"])
+
+        result = load_zarr("test.zarr")
+
+        # Check that the RasterStack was created with the correct exceptions
+        assert isinstance(result, RasterStack)
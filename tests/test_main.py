@@ -1,29 +1,33 @@
 """Test titiler.eopf.main.app."""
 
-import pytest
+import asyncio
 
+import pytest
 
-@pytest.mark.parametrize(
-    "endpoint",
-    [
-        "/",
-        "/conformance",
-        "/api",
-        "/api.html",
-        "/algorithms",
-        "/algorithms/hillshade",
-        "/colorMaps",
-        "/colorMaps/viridis",
-        "/tileMatrixSets",
-        "/tileMatrixSets/WebMercatorQuad",
-        "/_mgmt/ping",
-        "/_mgmt/health",
-    ],
+ENDPOINTS = (
+    "/",
+    "/conformance",
+    "/api",
+    "/api.html",
+    "/algorithms",
+    "/algorithms/hillshade",
+    "/colorMaps",
+    "/colorMaps/viridis",
+    "/tileMatrixSets",
+    "/tileMatrixSets/WebMercatorQuad",
+    "/_mgmt/ping",
+    "/_mgmt/health",
 )
-def test_get_routes(app, endpoint):
+
+
+@pytest.mark.asyncio
+async def test_get_routes(async_app):
     """Test GET routes."""
-    response = app.get(endpoint)
-    assert response.status_code == 200
+    responses = await asyncio.gather(
+        *(async_app.get(endpoint) for endpoint in ENDPOINTS)
+    )
+    for endpoint, response in zip(ENDPOINTS, responses, strict=True):
+        assert response.status_code == 200, endpoint
 
 
 def test_health(app):
@@ -42,42 +46,42 @@ def test_health(app):
     }
 
 
-def test_landing(app):
+@pytest.mark.asyncio
+async def test_landing(async_app):
     """Test Landing Page routes."""
-    response = app.get("/")
-    assert response.status_code == 200
-    assert response.headers["content-type"] == "application/json"
-
-    content = response.json()
+    json_response, html_param, json_accept, html_accept = await asyncio.gather(
+        async_app.get("/"),
+        async_app.get("/", params={"f": "html"}),
+        async_app.get("/", headers={"Accept": "application/json"}),
+        async_app.get("/", headers={"Accept": "text/html"}),
+    )
+
+    for response in (json_response, json_accept):
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+
+    for response in (html_param, html_accept):
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+
+    content = json_response.json()
     assert content["title"] == "TiTiler application for EOPF datasets"
 
-    response = app.get("/", params={"f": "html"})
-    assert response.status_code == 200
-    assert response.headers["content-type"].startswith("text/html")
-
-    response = app.get("/", headers={"Accept": "application/json"})
-    assert response.status_code == 200
-    assert response.headers["content-type"] == "application/json"
-
-    response = app.get("/", headers={"Accept": "text/html"})
-    assert response.status_code == 200
-    assert response.headers["content-type"].startswith("text/html")
-
 
-def test_conformance(app):
+@pytest.mark.asyncio
+async def test_conformance(async_app):
     """Test Conformance Page routes."""
-    response = app.get("/conformance")
-    assert response.status_code == 200
-    assert response.headers["content-type"] == "application/json"
-
-    response = app.get("/conformance", params={"f": "html"})
-    assert response.status_code == 200
-    assert response.headers["content-type"].startswith("text/html")
-
-    response = app.get("/conformance", headers={"Accept": "application/json"})
-    assert response.status_code == 200
-    assert response.headers["content-type"] == "application/json"
-
-    response = app.get("/conformance", headers={"Accept": "text/html"})
-    assert response.status_code == 200
-    assert response.headers["content-type"].startswith("text/html")
+    json_response, html_param, json_accept, html_accept = await asyncio.gather(
+        async_app.get("/conformance"),
+        async_app.get("/conformance", params={"f": "html"}),
+        async_app.get("/conformance", headers={"Accept": "application/json"}),
+        async_app.get("/conformance", headers={"Accept": "text/html"}),
+    )
+
+    for response in (json_response, json_accept):
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+
+    for response in (html_param, html_accept):
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
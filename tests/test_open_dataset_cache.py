@@ -25,10 +25,10 @@ def _redis_keys(client) -> set[str]:
     return {k.decode() for k in client.keys()}
 
 
-def _assert_bare_src_path_key(redis_client, dataset_path: str) -> None:
+def _assert_bare_src_path_key(redis_client, normalized_path: str) -> None:
     """Assert the dataset was cached under the bare (un-versioned) src_path key."""
     keys = _redis_keys(redis_client)
-    assert reader_mod._normalize_path(dataset_path) in keys
+    assert normalized_path in keys
     assert not any("#" in k for k in keys)
 
 
@@ -40,6 +40,12 @@ def reset_caches():
     _reset_all()
 
 
+@pytest.fixture
+def normalized_path(geozarr_dataset) -> str:
+    """Normalized dataset path, the base of its Redis cache keys."""
+    return reader_mod._normalize_path(geozarr_dataset)
+
+
 @pytest.fixture
 def redis_client(monkeypatch):
     """Enable the redis cache path and inject an in-process fake client.
@@ -74,7 +80,7 @@ def _count_opens(monkeypatch) -> list[int]:
 
 
 def test_append_changes_cache_key_and_rereads(
-    geozarr_dataset, redis_client, monkeypatch
+    geozarr_dataset, normalized_path, redis_client, monkeypatch
 ):
     """A changed version token writes a new Redis key and re-reads the store."""
     versions = iter(["v1", "v2"])
@@ -85,14 +91,13 @@ def test_append_changes_cache_key_and_rereads(
     open_dataset(geozarr_dataset)  # v2 -> miss -> read + cache <path>#v2
 
     assert opens[0] == 2
-    norm = reader_mod._normalize_path(geozarr_dataset)
     keys = _redis_keys(redis_client)
-    assert f"{norm}#v1" in keys
-    assert f"{norm}#v2" in keys
+    assert f"{normalized_path}#v1" in keys
+    assert f"{normalized_path}#v2" in keys
 
 
 def test_version_probe_failure_falls_back_to_src_path_key(
-    geozarr_dataset, redis_client, monkeypatch
+    geozarr_dataset, normalized_path, redis_client, monkeypatch
 ):
     """When the version probe returns None, the bare src_path key is used and no error escapes."""
     monkeypatch.setattr(reader_mod, "_store_version_cached", lambda src: None)
@@ -100,14 +105,14 @@ def test_version_probe_failure_falls_back_to_src_path_key(
     dt = open_dataset(geozarr_dataset)
 
     assert dt is not None
-    _assert_bare_src_path_key(redis_client, geozarr_dataset)
+    _assert_bare_src_path_key(redis_client, normalized_path)
 
 
 # --- Opt-out: version_probe_ttl=0 -> plain TTL behavior ---------------------
 
 
 def test_probe_disabled_skips_head_and_uses_plain_key(
-    geozarr_dataset, redis_client, monkeypatch
+    geozarr_dataset, normalized_path, redis_client, monkeypatch
 ):
     """version_probe_ttl=0 never probes the store and caches under the bare src_path key."""
     monkeypatch.setenv("TITILER_EOPF_CACHE_VERSION_PROBE_TTL", "0")
@@ -124,7 +129,7 @@ def test_probe_disabled_skips_head_and_uses_plain_key(
     open_dataset(geozarr_dataset)  # same TTL bucket -> served by the in-process memo
 
     assert opens[0] == 1
-    _assert_bare_src_path_key(redis_client, geozarr_dataset)
+    _assert_bare_src_path_key(redis_client, normalized_path)
 
 
 def test_probe_disabled_memo_expires_after_metadata_ttl(
@@ -9,613 +9,647 @@ from titiler.core.errors import BadRequestError
 from titiler.eopf.reader import GeoZarrReader, MissingVariables
 
 
-def test_open(geozarr_dataset):
+@pytest.fixture(scope="module")
+def center_tile_z11(src, center):
+    """Zoom 11 tile containing the src dataset center."""
+    lon, lat, _ = center
+    return src.tms.tile(lon, lat, 11)
+
+
+def test_open(src, geozarr_dataset):
     """test GeoZarrReader open."""
+    assert src.input == geozarr_dataset
+    assert isinstance(src.datatree, xarray.DataTree)
+
+    assert src.groups == ["/measurements/reflectance"]
+    assert src.variables == [
+        "/measurements/reflectance:b02",
+        "/measurements/reflectance:b03",
+        "/measurements/reflectance:b04",
+        "/measurements/reflectance:b05",
+        "/measurements/reflectance:b06",
+        "/measurements/reflectance:b07",
+        "/measurements/reflectance:b08",
+        "/measurements/reflectance:b11",
+        "/measurements/reflectance:b12",
+        "/measurements/reflectance:b8a",
+    ]
+
+    # We don't have the shape the whole dataset
+    assert not src.height
+    assert not src.width
+    assert not src.transform
+
+    # Default zooms to TMS zooms
+    assert src.minzoom == 0
+    assert src.maxzoom == 24
+
+    # Because we don't have top-level (dataTree) metadata
+    # we compute the min/max bounds for each groups
+    assert src.crs == "EPSG:4326"
+    assert src.bounds
+
+
+def test_zooms_for_group(src):
+    """test GeoZarrReader min/max zoom."""
+    # Default zooms to TMS zooms
+    assert src.minzoom == 0
+    assert src.maxzoom == 24
+
+    assert src.get_minzoom("/measurements/reflectance") == 10
+    assert src.get_maxzoom("/measurements/reflectance") == 14
+
+
+def test_info(src):
+    """test info method."""
+    # NOTE: defaulting to all the variables is covered by `test_dataset_3d`,
+    # through the `/info` endpoint
+    info = src.info(variables=["/measurements/reflectance:b02"])
+    assert list(info) == ["/measurements/reflectance:b02"]
+    info_b02 = info["/measurements/reflectance:b02"]
+    assert info_b02.crs == "http://www.opengis.net/def/crs/EPSG/0/32633"
+    assert info_b02.band_descriptions == [("b1", "b02")]
+    assert info_b02.width == 1000
+    assert info_b02.height == 1000
+
+    # Info is cached per variable, and handed out as a copy
+    info = src.info(variables=["/measurements/reflectance:b02"])
+    assert info["/measurements/reflectance:b02"] == info_b02
+    assert info["/measurements/reflectance:b02"] is not info_b02
+
+
+def test_info_cache(geozarr_dataset, monkeypatch):
+    """test info results are cached per reader, until it is closed."""
+    variables = ["/measurements/reflectance:b02"]
     with GeoZarrReader(geozarr_dataset) as src:
-        assert src.input == geozarr_dataset
-        assert isinstance(src.datatree, xarray.DataTree)
+        info = src.info(variables=variables)
 
-        assert src.groups == ["/measurements/reflectance"]
-        assert src.variables == [
-            "/measurements/reflectance:b02",
-            "/measurements/reflectance:b03",
-            "/measurements/reflectance:b04",
-            "/measurements/reflectance:b05",
-            "/measurements/reflectance:b06",
-            "/measurements/reflectance:b07",
-            "/measurements/reflectance:b08",
-            "/measurements/reflectance:b11",
-            "/measurements/reflectance:b12",
-            "/measurements/reflectance:b8a",
-        ]
+        def _get_variable(*args, **kwargs):
+            raise AssertionError("info should be served from the cache")
 
-        # We don't have the shape the whole dataset
-        assert not src.height
-        assert not src.width
-        assert not src.transform
+        # Served from the cache, without reading the variable again
+        monkeypatch.setattr(src, "_get_variable", _get_variable)
+        assert src.info(variables=variables) == info
 
-        # Default zooms to TMS zooms
-        assert src.minzoom == 0
-        assert src.maxzoom == 24
+        # Changing a returned Info does not alter the cached one
+        expected = src.info(variables=variables)
+        b02 = info["/measurements/reflectance:b02"]
+        b02.nodata_type = "Mask"
+        b02.band_metadata.clear()
+        assert src.info(variables=variables) == expected
 
-        # Because we don't have top-level (dataTree) metadata
-        # we compute the min/max bounds for each groups
-        assert src.crs == "EPSG:4326"
-        assert src.bounds
+        # A different `sel` is a different entry: it goes to the (failing)
+        # lookup, and the variable is skipped
+        assert src.info(variables=variables, sel=["band=1"]) == {}
 
+    assert not src._info_cache
 
-def test_zooms_for_group(geozarr_dataset):
-    """test GeoZarrReader min/max zoom."""
+
+def test_default_variable_cache(geozarr_dataset, monkeypatch):
+    """test the unconstrained variable selection is cached, until the reader is closed."""
+    group = "/measurements/reflectance"
     with GeoZarrReader(geozarr_dataset) as src:
-        # Default zooms to TMS zooms
-        assert src.minzoom == 0
-        assert src.maxzoom == 24
+        da = src._get_variable(group, "b02")
+        assert da.shape == (1000, 1000)
 
-        assert src.get_minzoom("/measurements/reflectance") == 10
-        assert src.get_maxzoom("/measurements/reflectance") == 14
+        # Served from the cache, without going through the datatree
+        monkeypatch.setattr(src, "datatree", {})
+        cached = src._get_variable(group, "b02")
+        xarray.testing.assert_identical(cached, da)
 
+        # Each call gets its own (shallow) copy
+        cached.attrs["name"] = "changed"
+        assert "name" not in src._get_variable(group, "b02").attrs
 
-def test_info(geozarr_dataset):
-    """test info method."""
-    with GeoZarrReader(geozarr_dataset) as src:
-        # Default to all variables
-        info = src.info()
-        assert src.variables == list(info)
-        info = src.info(variables=["/measurements/reflectance:b02"])
-        info_b02 = info["/measurements/reflectance:b02"]
-        assert info_b02.crs == "http://www.opengis.net/def/crs/EPSG/0/32633"
-        assert info_b02.band_descriptions == [("b1", "b02")]
-        assert info_b02.width == 1000
-        assert info_b02.height == 1000
-
-
-def test_tile(geozarr_dataset):
-    """test tile method."""
-    with GeoZarrReader(geozarr_dataset) as src:
-        bounds = src.bounds
-        lon, lat = (bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2
+        # Constrained selections are not cached
+        with pytest.raises(KeyError):
+            src._get_variable(group, "b02", max_size=256)
 
-        tile = src.tms.tile(lon, lat, 10)
+    assert not src._default_variable_cache
 
-        img = src.tile(*tile, variables=["/measurements/reflectance:b02"])
-        assert img.band_names == ["b1"]
-        assert img.band_descriptions == ["/measurements/reflectance:b02"]
-        assert img.data.shape == (1, 256, 256)
 
-        img = src.tile(
-            *tile,
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-        )
-        assert img.band_names == ["b1", "b2"]
-        assert img.band_descriptions == [
+def test_tile(src, center):
+    """test tile method."""
+    _, _, tile = center
+
+    img = src.tile(*tile, variables=["/measurements/reflectance:b02"])
+    assert img.band_names == ["b1"]
+    assert img.band_descriptions == ["/measurements/reflectance:b02"]
+    assert img.data.shape == (1, 256, 256)
+
+    img = src.tile(
+        *tile,
+        variables=[
             "/measurements/reflectance:b02",
             "/measurements/reflectance:b03",
-        ]
-        assert img.data.shape == (2, 256, 256)
-
-        img_expr = src.tile(
+        ],
+    )
+    assert img.band_names == ["b1", "b2"]
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02",
+        "/measurements/reflectance:b03",
+    ]
+    assert img.data.shape == (2, 256, 256)
+
+    img_expr = src.tile(
+        *tile,
+        expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
+    )
+    assert img_expr.band_names == ["b1"]
+    assert img_expr.band_descriptions == [
+        "/measurements/reflectance:b02+/measurements/reflectance:b03"
+    ]
+    assert img_expr.data.shape == (1, 256, 256)
+    numpy.testing.assert_array_equal(img_expr.data, img.data.sum(axis=0, keepdims=True))
+    numpy.testing.assert_array_equal(
+        img_expr.array.mask,
+        numpy.logical_or.reduce(img.array.mask, axis=0, keepdims=True),
+    )
+
+    img_expr = src.tile(
+        *tile,
+        expression="/measurements/reflectance:b02+/measurements/reflectance:b03;/measurements/reflectance:b03",
+    )
+    assert img_expr.band_names == ["b1", "b2"]
+    assert img_expr.band_descriptions == [
+        "/measurements/reflectance:b02+/measurements/reflectance:b03",
+        "/measurements/reflectance:b03",
+    ]
+    assert img_expr.data.shape == (2, 256, 256)
+    numpy.testing.assert_array_equal(img_expr.data[0], img.data.sum(axis=0))
+
+    with pytest.warns(ExpressionMixingWarning):
+        img = src.tile(
             *tile,
+            variables=["/measurements/reflectance:b02"],
             expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
         )
-        assert img_expr.band_names == ["b1"]
-        assert img_expr.band_descriptions == [
+        assert img.band_descriptions == [
             "/measurements/reflectance:b02+/measurements/reflectance:b03"
         ]
-        assert img_expr.data.shape == (1, 256, 256)
-        numpy.testing.assert_equal(
-            img_expr.data, numpy.ma.sum(img.data, axis=0, keepdims=True)
-        )
-
-        img_expr = src.tile(
-            *tile,
-            expression="/measurements/reflectance:b02+/measurements/reflectance:b03;/measurements/reflectance:b03",
-        )
-        assert img_expr.band_names == ["b1", "b2"]
-        assert img_expr.band_descriptions == [
-            "/measurements/reflectance:b02+/measurements/reflectance:b03",
-            "/measurements/reflectance:b03",
-        ]
-        assert img_expr.data.shape == (2, 256, 256)
-        numpy.testing.assert_equal(
-            img_expr.data[0], numpy.ma.sum(img.data, axis=0, keepdims=True)[0]
-        )
-
-        with pytest.warns(ExpressionMixingWarning):
-            img = src.tile(
-                *tile,
-                variables=["/measurements/reflectance:b02"],
-                expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            )
-            assert img.band_descriptions == [
-                "/measurements/reflectance:b02+/measurements/reflectance:b03"
-            ]
-            assert img.data.shape == (1, 256, 256)
+        assert img.data.shape == (1, 256, 256)
 
-        with pytest.raises(MissingVariables):
-            src.tile(*tile)
+    with pytest.raises(MissingVariables):
+        src.tile(*tile)
 
 
-def test_point(geozarr_dataset):
+def test_point(src, center):
     """test point method."""
-    with GeoZarrReader(geozarr_dataset) as src:
-        bounds = src.bounds
-        lon, lat = (bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2
-        pt = src.point(lon, lat, variables=["/measurements/reflectance:b02"])
-        assert pt.band_names == ["b1"]
-        assert pt.band_descriptions == ["/measurements/reflectance:b02"]
-        assert pt.data.shape == (1,)
-
-        pt = src.point(
-            lon,
-            lat,
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-        )
-        assert pt.band_names == ["b1", "b2"]
-        assert pt.band_descriptions == [
+    lon, lat, _ = center
+    pt = src.point(lon, lat, variables=["/measurements/reflectance:b02"])
+    assert pt.band_names == ["b1"]
+    assert pt.band_descriptions == ["/measurements/reflectance:b02"]
+    assert pt.data.shape == (1,)
+
+    pt = src.point(
+        lon,
+        lat,
+        variables=[
             "/measurements/reflectance:b02",
             "/measurements/reflectance:b03",
-        ]
-        assert pt.data.shape == (2,)
-
-        pt_expr = src.point(
+        ],
+    )
+    assert pt.band_names == ["b1", "b2"]
+    assert pt.band_descriptions == [
+        "/measurements/reflectance:b02",
+        "/measurements/reflectance:b03",
+    ]
+    assert pt.data.shape == (2,)
+
+    pt_expr = src.point(
+        lon,
+        lat,
+        expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
+    )
+    assert pt_expr.band_names == ["b1"]
+    assert pt_expr.band_descriptions == [
+        "/measurements/reflectance:b02+/measurements/reflectance:b03"
+    ]
+    assert pt_expr.data.shape == (1,)
+    assert pt_expr.data == pt.data[0] + pt.data[1]
+
+    with pytest.warns(ExpressionMixingWarning):
+        pt = src.point(
             lon,
             lat,
+            variables=["/measurements/reflectance:b02"],
             expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
         )
-        assert pt_expr.band_names == ["b1"]
-        assert pt_expr.band_descriptions == [
+        assert pt.band_descriptions == [
             "/measurements/reflectance:b02+/measurements/reflectance:b03"
         ]
-        assert pt_expr.data.shape == (1,)
-        assert pt_expr.data == pt.data[0] + pt.data[1]
-
-        with pytest.warns(ExpressionMixingWarning):
-            pt = src.point(
-                lon,
-                lat,
-                variables=["/measurements/reflectance:b02"],
-                expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            )
-            assert pt.band_descriptions == [
-                "/measurements/reflectance:b02+/measurements/reflectance:b03"
-            ]
-            assert pt.data.shape == (1,)
+        assert pt.data.shape == (1,)
 
-        with pytest.raises(MissingVariables):
-            src.point(lon, lat)
+    with pytest.raises(MissingVariables):
+        src.point(lon, lat)
 
 
-def test_statistics(geozarr_dataset):
+def test_statistics(src):
     """test statistics method."""
-    with GeoZarrReader(geozarr_dataset) as src:
-        with pytest.raises(NotImplementedError):
-            src.statistics(variables=["/measurements/reflectance:b02"])
+    with pytest.raises(NotImplementedError):
+        src.statistics(variables=["/measurements/reflectance:b02"])
 
 
-def test_preview(geozarr_dataset):
+def test_preview(src):
     """test preview method."""
-    with GeoZarrReader(geozarr_dataset) as src:
-        img = src.preview(variables=["/measurements/reflectance:b02"], max_size=128)
-        assert img.array.shape == (1, 128, 128)
+    img = src.preview(variables=["/measurements/reflectance:b02"], max_size=128)
+    assert img.array.shape == (1, 128, 128)
 
-        img = src.preview(
-            variables=["/measurements/reflectance:b02"],
-            max_size=128,
-            dst_crs="epsg:4326",
-        )
-        assert img.array.shape == (1, 102, 128)
+    img = src.preview(
+        variables=["/measurements/reflectance:b02"],
+        max_size=128,
+        dst_crs="epsg:4326",
+    )
+    assert img.array.shape == (1, 102, 128)
 
 
-def test_part(geozarr_dataset):
+def test_part(src, center_tile_z11):
     """test part method."""
-    with GeoZarrReader(geozarr_dataset) as src:
-        bounds = src.bounds
-        lon, lat = (bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2
-        tile = src.tms.tile(lon, lat, 11)
-        bbox = src.tms.xy_bounds(*tile)
-
-        img = src.part(
-            bbox,
-            bounds_crs="epsg:3857",
-            dst_crs="epsg:3857",
-            variables=["/measurements/reflectance:b02"],
-            width=256,
-            height=256,
-        )
-
-        img_tile = src.tile(
-            tile.x,
-            tile.y,
-            tile.z,
-            variables=["/measurements/reflectance:b02"],
-        )
-        numpy.testing.assert_array_equal(img.array, img_tile.array)
-
-
-def test_feature(geozarr_dataset):
+    tile = center_tile_z11
+    bbox = src.tms.xy_bounds(*tile)
+
+    img = src.part(
+        bbox,
+        bounds_crs="epsg:3857",
+        dst_crs="epsg:3857",
+        variables=["/measurements/reflectance:b02"],
+        width=256,
+        height=256,
+    )
+
+    img_tile = src.tile(
+        tile.x,
+        tile.y,
+        tile.z,
+        variables=["/measurements/reflectance:b02"],
+    )
+    numpy.testing.assert_array_equal(img.array, img_tile.array)
+
+
+def test_feature(src, center_tile_z11, geozarr_dataset):
     """test feature method."""
-    with GeoZarrReader(geozarr_dataset) as src:
-        bounds = src.bounds
-        lon, lat = (bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2
-        xmin, ymin, xmax, ymax = src.tms.bounds(*src.tms.tile(lon, lat, 11))
+    xmin, ymin, xmax, ymax = src.tms.bounds(*center_tile_z11)
 
-        feat = {
-            "type": "Polygon",
-            "coordinates": [
-                [(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax), (xmin, ymin)]
-            ],
-        }
+    feat = {
+        "type": "Polygon",
+        "coordinates": [
+            [(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax), (xmin, ymin)]
+        ],
+    }
 
-        img = src.feature(feat, variables=["/measurements/reflectance:b02"])
-        assert img.assets == [geozarr_dataset]
+    img = src.feature(feat, variables=["/measurements/reflectance:b02"])
+    assert img.assets == [geozarr_dataset]
 
 
-def test_3d_geozarr(geozarr_3d_dataset):
+def test_3d_geozarr(src_3d):
     """"""
-    with GeoZarrReader(geozarr_3d_dataset) as src:
-        assert src.groups == ["/measurements/reflectance"]
-        assert src.variables == [
+    assert src_3d.groups == ["/measurements/reflectance"]
+    assert src_3d.variables == [
+        "/measurements/reflectance:b02",
+        "/measurements/reflectance:b03",
+        "/measurements/reflectance:b04",
+        "/measurements/reflectance:b05",
+        "/measurements/reflectance:b06",
+        "/measurements/reflectance:b07",
+        "/measurements/reflectance:b08",
+        "/measurements/reflectance:b11",
+        "/measurements/reflectance:b12",
+        "/measurements/reflectance:b8a",
+    ]
+
+    # Info
+    info = src_3d.info(variables=["/measurements/reflectance:b02"])
+    v_info = info["/measurements/reflectance:b02"]
+    assert len(v_info.band_descriptions) == 2
+    assert v_info.band_descriptions[0][0] == "b1"
+    assert v_info.band_descriptions[0][1] == "2022-01-01T00:00:00.000000000"
+    assert v_info.name == "b02"
+    assert "time" in v_info.dimensions
+    assert v_info.count == 2
+
+    info = src_3d.info(
+        variables=["/measurements/reflectance:b02"],
+        sel=["time=2022-01-02T00:00:00.000000000"],
+    )
+    v_info = info["/measurements/reflectance:b02"]
+    assert len(v_info.band_descriptions) == 1
+    assert v_info.band_descriptions[0][0] == "b1"
+    assert v_info.band_descriptions[0][1] == "2022-01-02T00:00:00.000000000"
+    assert v_info.name == "b02"
+    assert "time" not in v_info.dimensions
+    assert v_info.count == 1
+
+    info = src_3d.info(
+        variables=["/measurements/reflectance:b02"],
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    v_info = info["/measurements/reflectance:b02"]
+    assert len(v_info.band_descriptions) == 1
+    assert v_info.band_descriptions[0][0] == "b1"
+    assert v_info.band_descriptions[0][1] == "2022-01-02T00:00:00.000000000"
+    assert v_info.name == "b02"
+    assert "time" not in v_info.dimensions
+    assert v_info.count == 1
+
+    # Preview
+    img = src_3d.preview(
+        variables=["/measurements/reflectance:b02"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+    ]
+
+    img = src_3d.preview(
+        variables=[
             "/measurements/reflectance:b02",
             "/measurements/reflectance:b03",
-            "/measurements/reflectance:b04",
-            "/measurements/reflectance:b05",
-            "/measurements/reflectance:b06",
-            "/measurements/reflectance:b07",
-            "/measurements/reflectance:b08",
-            "/measurements/reflectance:b11",
-            "/measurements/reflectance:b12",
-            "/measurements/reflectance:b8a",
-        ]
-
-        # Info
-        info = src.info(variables=["/measurements/reflectance:b02"])
-        v_info = info["/measurements/reflectance:b02"]
-        assert len(v_info.band_descriptions) == 2
-        assert v_info.band_descriptions[0][0] == "b1"
-        assert v_info.band_descriptions[0][1] == "2022-01-01T00:00:00.000000000"
-        assert v_info.name == "b02"
-        assert "time" in v_info.dimensions
-        assert v_info.count == 2
-
-        info = src.info(
-            variables=["/measurements/reflectance:b02"],
-            sel=["time=2022-01-02T00:00:00.000000000"],
-        )
-        v_info = info["/measurements/reflectance:b02"]
-        assert len(v_info.band_descriptions) == 1
-        assert v_info.band_descriptions[0][0] == "b1"
-        assert v_info.band_descriptions[0][1] == "2022-01-02T00:00:00.000000000"
-        assert v_info.name == "b02"
-        assert "time" not in v_info.dimensions
-        assert v_info.count == 1
-
-        info = src.info(
-            variables=["/measurements/reflectance:b02"],
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
-        )
-        v_info = info["/measurements/reflectance:b02"]
-        assert len(v_info.band_descriptions) == 1
-        assert v_info.band_descriptions[0][0] == "b1"
-        assert v_info.band_descriptions[0][1] == "2022-01-02T00:00:00.000000000"
-        assert v_info.name == "b02"
-        assert "time" not in v_info.dimensions
-        assert v_info.count == 1
-
-        # Preview
-        img = src.preview(
-            variables=["/measurements/reflectance:b02"],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-        ]
-
-        img = src.preview(
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
-        ]
-
-        img = src.preview(
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
-        ]
-
-        # Cannot use expression with multi-bands variables
-        with pytest.raises(
-            ValueError, match="Can't use `expression` for multidim dataset"
-        ):
-            _ = src.preview(
-                expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            )
-
-        img = src.preview(
+        ],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
+    ]
+
+    img = src_3d.preview(
+        variables=[
+            "/measurements/reflectance:b02",
+            "/measurements/reflectance:b03",
+        ],
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
+    ]
+
+    # Cannot use expression with multi-bands variables
+    with pytest.raises(ValueError, match="Can't use `expression` for multidim dataset"):
+        _ = src_3d.preview(
             expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02+/measurements/reflectance:b03"
-        ]
-
-        # Point
-        bounds = src.get_geographic_bounds("EPSG:4326")
-        lon, lat = (bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2
-
-        pt = src.point(
-            lon,
-            lat,
-            coord_crs="epsg:4326",
-            variables=["/measurements/reflectance:b02"],
-        )
-        assert pt.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-        ]
-
-        pt = src.point(
-            lon,
-            lat,
-            coord_crs="epsg:4326",
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-        )
-        assert pt.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
-        ]
-
-        pt = src.point(
-            lon,
-            lat,
-            coord_crs="epsg:4326",
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
         )
-        assert pt.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
-        ]
-
-        # Cannot use expression with multi-bands variables
-        with pytest.raises(
-            ValueError, match="Can't use `expression` for multidim dataset"
-        ):
-            _ = src.point(
-                lon,
-                lat,
-                coord_crs="epsg:4326",
-                expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            )
 
-        pt = src.point(
+    img = src_3d.preview(
+        expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02+/measurements/reflectance:b03"
+    ]
+
+    # Point
+    bounds = src_3d.get_geographic_bounds("EPSG:4326")
+    lon, lat = (bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2
+
+    pt = src_3d.point(
+        lon,
+        lat,
+        coord_crs="epsg:4326",
+        variables=["/measurements/reflectance:b02"],
+    )
+    assert pt.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+    ]
+
+    pt = src_3d.point(
+        lon,
+        lat,
+        coord_crs="epsg:4326",
+        variables=[
+            "/measurements/reflectance:b02",
+            "/measurements/reflectance:b03",
+        ],
+    )
+    assert pt.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
+    ]
+
+    pt = src_3d.point(
+        lon,
+        lat,
+        coord_crs="epsg:4326",
+        variables=[
+            "/measurements/reflectance:b02",
+            "/measurements/reflectance:b03",
+        ],
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    assert pt.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
+    ]
+
+    # Cannot use expression with multi-bands variables
+    with pytest.raises(ValueError, match="Can't use `expression` for multidim dataset"):
+        _ = src_3d.point(
             lon,
             lat,
             coord_crs="epsg:4326",
             expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
         )
-        assert pt.band_descriptions == [
-            "/measurements/reflectance:b02+/measurements/reflectance:b03"
-        ]
-
-        # Tile
-        tile = src.tms.tile(lon, lat, 10)
 
-        img = src.tile(
-            *tile,
-            variables=["/measurements/reflectance:b02"],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-        ]
-
-        img = src.tile(
-            *tile,
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
-        ]
-
-        img = src.tile(
-            *tile,
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
-        ]
-
-        # Cannot use expression with multi-bands variables
-        with pytest.raises(
-            ValueError, match="Can't use `expression` for multidim dataset"
-        ):
-            _ = src.tile(
-                *tile,
-                expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            )
-
-        img = src.tile(
+    pt = src_3d.point(
+        lon,
+        lat,
+        coord_crs="epsg:4326",
+        expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    assert pt.band_descriptions == [
+        "/measurements/reflectance:b02+/measurements/reflectance:b03"
+    ]
+
+    # Tile
+    tile = src_3d.tms.tile(lon, lat, 10)
+
+    img = src_3d.tile(
+        *tile,
+        variables=["/measurements/reflectance:b02"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+    ]
+
+    img = src_3d.tile(
+        *tile,
+        variables=[
+            "/measurements/reflectance:b02",
+            "/measurements/reflectance:b03",
+        ],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
+    ]
+
+    img = src_3d.tile(
+        *tile,
+        variables=[
+            "/measurements/reflectance:b02",
+            "/measurements/reflectance:b03",
+        ],
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
+    ]
+
+    # Cannot use expression with multi-bands variables
+    with pytest.raises(ValueError, match="Can't use `expression` for multidim dataset"):
+        _ = src_3d.tile(
             *tile,
             expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
         )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02+/measurements/reflectance:b03"
-        ]
 
-        # Part
-        bbox = src.tms.xy_bounds(*tile)
-        img = src.part(
-            bbox,
-            bounds_crs="epsg:3857",
-            variables=["/measurements/reflectance:b02"],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-        ]
-
-        img = src.part(
-            bbox,
-            bounds_crs="epsg:3857",
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
-        ]
-
-        img = src.part(
-            bbox,
-            bounds_crs="epsg:3857",
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
-        ]
-
-        # Cannot use expression with multi-bands variables
-        with pytest.raises(
-            ValueError, match="Can't use `expression` for multidim dataset"
-        ):
-            _ = src.part(
-                bbox,
-                bounds_crs="epsg:3857",
-                expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            )
-
-        img = src.part(
+    img = src_3d.tile(
+        *tile,
+        expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02+/measurements/reflectance:b03"
+    ]
+
+    # Part
+    bbox = src_3d.tms.xy_bounds(*tile)
+    img = src_3d.part(
+        bbox,
+        bounds_crs="epsg:3857",
+        variables=["/measurements/reflectance:b02"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+    ]
+
+    img = src_3d.part(
+        bbox,
+        bounds_crs="epsg:3857",
+        variables=[
+            "/measurements/reflectance:b02",
+            "/measurements/reflectance:b03",
+        ],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
+    ]
+
+    img = src_3d.part(
+        bbox,
+        bounds_crs="epsg:3857",
+        variables=[
+            "/measurements/reflectance:b02",
+            "/measurements/reflectance:b03",
+        ],
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
+    ]
+
+    # Cannot use expression with multi-bands variables
+    with pytest.raises(ValueError, match="Can't use `expression` for multidim dataset"):
+        _ = src_3d.part(
             bbox,
             bounds_crs="epsg:3857",
             expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02+/measurements/reflectance:b03"
-        ]
-
-        # Feature
-        west, south, east, north = bbox
-        feature = {
-            "type": "Polygon",
-            "coordinates": [
-                [
-                    [west, south],
-                    [west, north],
-                    [east, north],
-                    [east, south],
-                    [west, south],
-                ]
-            ],
-        }
-
-        img = src.feature(
-            feature,
-            shape_crs="epsg:3857",
-            variables=["/measurements/reflectance:b02"],
         )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-        ]
-
-        img = src.feature(
-            feature,
-            shape_crs="epsg:3857",
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-01T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
-        ]
-
-        img = src.feature(
-            feature,
-            shape_crs="epsg:3857",
-            variables=[
-                "/measurements/reflectance:b02",
-                "/measurements/reflectance:b03",
-            ],
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
-        )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
-            "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
-        ]
 
-        # Cannot use expression with multi-bands variables
-        with pytest.raises(
-            ValueError, match="Can't use `expression` for multidim dataset"
-        ):
-            _ = src.feature(
-                feature,
-                shape_crs="epsg:3857",
-                expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            )
-
-        img = src.feature(
+    img = src_3d.part(
+        bbox,
+        bounds_crs="epsg:3857",
+        expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02+/measurements/reflectance:b03"
+    ]
+
+    # Feature
+    west, south, east, north = bbox
+    feature = {
+        "type": "Polygon",
+        "coordinates": [
+            [
+                [west, south],
+                [west, north],
+                [east, north],
+                [east, south],
+                [west, south],
+            ]
+        ],
+    }
+
+    img = src_3d.feature(
+        feature,
+        shape_crs="epsg:3857",
+        variables=["/measurements/reflectance:b02"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+    ]
+
+    img = src_3d.feature(
+        feature,
+        shape_crs="epsg:3857",
+        variables=[
+            "/measurements/reflectance:b02",
+            "/measurements/reflectance:b03",
+        ],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-01T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
+    ]
+
+    img = src_3d.feature(
+        feature,
+        shape_crs="epsg:3857",
+        variables=[
+            "/measurements/reflectance:b02",
+            "/measurements/reflectance:b03",
+        ],
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02|2022-01-02T00:00:00.000000000",
+        "/measurements/reflectance:b03|2022-01-02T00:00:00.000000000",
+    ]
+
+    # Cannot use expression with multi-bands variables
+    with pytest.raises(ValueError, match="Can't use `expression` for multidim dataset"):
+        _ = src_3d.feature(
             feature,
             shape_crs="epsg:3857",
             expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
-            sel=["time=nearest::2022-01-03T00:00:00.000000000"],
         )
-        assert img.band_descriptions == [
-            "/measurements/reflectance:b02+/measurements/reflectance:b03"
-        ]
+
+    img = src_3d.feature(
+        feature,
+        shape_crs="epsg:3857",
+        expression="/measurements/reflectance:b02+/measurements/reflectance:b03",
+        sel=["time=nearest::2022-01-03T00:00:00.000000000"],
+    )
+    assert img.band_descriptions == [
+        "/measurements/reflectance:b02+/measurements/reflectance:b03"
+    ]
 
 
 def test_scale_offset(geozarr_so):
@@ -627,15 +661,14 @@ def test_scale_offset(geozarr_so):
         assert img.array.mask[0, 0, 0]
 
 
-def test_sel_datetime_happy_path(geozarr_3d_dataset):
+def test_sel_datetime_happy_path(src_3d):
     """A datetime64 time axis selects by an ISO datetime string (regression)."""
-    with GeoZarrReader(geozarr_3d_dataset) as src:
-        da = src._get_variable(
-            "/measurements/reflectance",
-            "b02",
-            sel=["time=2022-01-02T00:00:00.000000000"],
-        )
-        assert "time" not in da.dims
+    da = src_3d._get_variable(
+        "/measurements/reflectance",
+        "b02",
+        sel=["time=2022-01-02T00:00:00.000000000"],
+    )
+    assert "time" not in da.dims
 
 
 def test_sel_on_int64_axis_raises_bad_request(geozarr_3d_dataset):
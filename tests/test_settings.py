@@ -1,5 +1,7 @@
 """test for settings"""
 
+import os
+
 import pytest
 from pydantic import ValidationError
 from pydantic_settings import SettingsConfigDict
@@ -17,6 +19,13 @@ class IsolatedDataStoreSettings(DataStoreSettings):
     )
 
 
+@pytest.fixture(autouse=True)
+def clear_store_env(monkeypatch):
+    """Clear environment variables that might interfere with the store settings."""
+    for key in [k for k in os.environ if k.startswith("TITILER_EOPF_STORE_")]:
+        monkeypatch.delenv(key)
+
+
 @pytest.mark.parametrize(
     "params,url",
     [
@@ -25,13 +34,8 @@ class IsolatedDataStoreSettings(DataStoreSettings):
         ({"url": "s3://yeah/yo"}, "s3://yeah/yo"),
     ],
 )
-def test_datastore_settings(params, url, monkeypatch):
+def test_datastore_settings(params, url):
     """Test DataStoreSettings."""
-    # Clear environment variables that might interfere with test
-    monkeypatch.delenv("TITILER_EOPF_STORE_URL", raising=False)
-    monkeypatch.delenv("TITILER_EOPF_STORE_SCHEME", raising=False)
-    monkeypatch.delenv("TITILER_EOPF_STORE_HOST", raising=False)
-    monkeypatch.delenv("TITILER_EOPF_STORE_PATH", raising=False)
     settings = IsolatedDataStoreSettings(**params)
     assert str(settings.url) == url
 
@@ -45,13 +49,8 @@ def test_datastore_settings(params, url, monkeypatch):
         {"url": None, "scheme": None, "host": None, "path": None},
     ],
 )
-def test_datastore_settings_error(params, monkeypatch):
+def test_datastore_settings_error(params):
     """Missing URL or scheme/host."""
-    # Clear environment variables that might interfere with test
-    monkeypatch.delenv("TITILER_EOPF_STORE_URL", raising=False)
-    monkeypatch.delenv("TITILER_EOPF_STORE_SCHEME", raising=False)
-    monkeypatch.delenv("TITILER_EOPF_STORE_HOST", raising=False)
-    monkeypatch.delenv("TITILER_EOPF_STORE_PATH", raising=False)
     with pytest.raises(ValidationError):
         IsolatedDataStoreSettings(**params)
 
@@ -12,7 +12,7 @@ from .backends.base import CacheBackend
 from .decorators import CacheManager, cache_control, cached_metadata, cached_tile
 from .middleware import CacheControlMiddleware, TileCacheMiddleware
 from .settings import CacheRedisSettings, CacheS3Settings, CacheSettings
-from .utils import CacheKeyGenerator
+from .utils import CacheKeyGenerator, get_generator
 
 __all__ = [
     "CacheBackend",
@@ -22,6 +22,7 @@ __all__ = [
     "TileCacheMiddleware",
     "CacheControlMiddleware",
     "CacheKeyGenerator",
+    "get_generator",
     "cached_tile",
     "cached_metadata",
     "cache_control",
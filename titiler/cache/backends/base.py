@@ -1,7 +1,15 @@
 """Abstract cache backend interface."""
 
 import abc
-from typing import Any, Optional, Pattern, Union
+import asyncio
+import logging
+from itertools import islice
+from typing import Any, Iterable, Optional, Pattern, Union
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of concurrent `delete` calls in `delete_many`
+DELETE_CONCURRENCY = 50
 
 
 class CacheBackend(abc.ABC):
@@ -52,6 +60,32 @@ class CacheBackend(abc.ABC):
         """
         ...
 
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several cache entries.
+
+        Args:
+            keys: Cache keys to delete
+
+        Returns:
+            Number of keys that existed and were deleted.
+            Base implementation calls `delete` concurrently for each key,
+            `DELETE_CONCURRENCY` keys at a time. Failed deletes are logged
+            and not counted.
+        """
+        deleted = 0
+        keys = iter(keys)
+        while batch := list(islice(keys, DELETE_CONCURRENCY)):
+            results = await asyncio.gather(
+                *(self.delete(key) for key in batch), return_exceptions=True
+            )
+            for key, result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    logger.error("Failed to delete cache key %s: %s", key, result)
+                elif result is True:
+                    deleted += 1
+
+        return deleted
+
     @abc.abstractmethod
     async def exists(self, key: str) -> bool:
         """Check if cache key exists.
@@ -1,7 +1,8 @@
 """Redis cache backend implementation."""
 
 import logging
-from typing import Any, Optional, Pattern, Union
+from itertools import islice
+from typing import Any, Iterable, Optional, Pattern, Union
 
 from ..backends.base import CacheBackend, CacheBackendUnavailable, CacheError
 from ..settings import CacheRedisSettings
@@ -13,6 +14,9 @@ except ImportError:  # pragma: nocover
 
 logger = logging.getLogger(__name__)
 
+# Number of keys sent per UNLINK command when deleting in bulk
+DELETE_BATCH_SIZE = 500
+
 
 class RedisCacheBackend(CacheBackend):
     """Redis-based cache backend with async support."""
@@ -133,6 +137,30 @@ class RedisCacheBackend(CacheBackend):
             logger.error(f"Redis delete error for key {key}: {e}")
             return False
 
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete cache entries from Redis, unlinking them in pipelined batches."""
+        try:
+            client = await self._get_client()
+            self._stats["total_operations"] += 1
+
+            keys = iter(keys)
+            async with client.pipeline(transaction=False) as pipe:
+                while batch := list(islice(keys, DELETE_BATCH_SIZE)):
+                    pipe.unlink(*batch)
+                results = await pipe.execute()
+
+            deleted = sum(results)
+            logger.debug(f"Cache DELETE many (deleted: {deleted})")
+            return deleted
+
+        except CacheBackendUnavailable:
+            self._stats["errors"] += 1
+            return 0
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(f"Redis delete many error: {e}")
+            return 0
+
     async def exists(self, key: str) -> bool:
         """Check if cache key exists in Redis."""
         try:
@@ -163,11 +191,17 @@ class RedisCacheBackend(CacheBackend):
             else:
                 redis_pattern = str(pattern)
 
-            # Use SCAN to find matching keys (more memory efficient than KEYS)
+            # Use SCAN to find matching keys (more memory efficient than KEYS),
+            # unlinking them in batches
             deleted = 0
+            batch = []
             async for key in client.scan_iter(match=redis_pattern):
-                if await client.delete(key):
-                    deleted += 1
+                batch.append(key)
+                if len(batch) >= DELETE_BATCH_SIZE:
+                    deleted += await self.delete_many(batch)
+                    batch = []
+            if batch:
+                deleted += await self.delete_many(batch)
 
             logger.debug(f"Cache CLEAR pattern: {redis_pattern} (deleted: {deleted})")
             return deleted
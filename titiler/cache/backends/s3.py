@@ -1,8 +1,10 @@
 """S3 storage backend implementation."""
 
+import fnmatch
 import logging
+import re
 from datetime import datetime, timezone
-from typing import Any, Optional, Pattern, Union
+from typing import Any, Callable, Optional, Pattern, Union
 
 from ..backends.base import CacheBackend, CacheBackendUnavailable, CacheError
 from ..settings import CacheS3Settings
@@ -387,6 +389,13 @@ class S3StorageBackend(CacheBackend):
                 )
                 prefix = self._get_object_key(pattern_str[:wildcard_pos])
 
+            # Build the matcher once rather than for every listed object
+            matches = (
+                pattern.match
+                if hasattr(pattern, "match")
+                else self._glob_matcher(pattern_str)
+            )
+
             deleted = 0
             paginator = client.get_paginator("list_objects_v2")
 
@@ -402,13 +411,8 @@ class S3StorageBackend(CacheBackend):
                     # Convert back to cache key for pattern matching
                     cache_key = object_key.replace("/", ":")
 
-                    if hasattr(pattern, "match"):
-                        if pattern.match(cache_key):
-                            objects_to_delete.append({"Key": object_key})
-                    else:
-                        # Simple glob matching
-                        if self._glob_match(cache_key, pattern_str):
-                            objects_to_delete.append({"Key": object_key})
+                    if matches(cache_key):
+                        objects_to_delete.append({"Key": object_key})
 
                 # Batch delete matching objects
                 if objects_to_delete:
@@ -428,11 +432,15 @@ class S3StorageBackend(CacheBackend):
             logger.error(f"S3 clear pattern error for {pattern}: {e}")
             return 0
 
-    def _glob_match(self, text: str, pattern: str) -> bool:
-        """Simple glob pattern matching for S3 object filtering."""
-        import fnmatch
+    @staticmethod
+    def _glob_matcher(pattern: str) -> Callable[[str], Any]:
+        """Build a glob pattern matcher for S3 object filtering."""
+        # Common `prefix*` invalidation patterns only need a prefix check
+        if pattern.endswith("*") and not any(c in pattern[:-1] for c in "*?["):
+            prefix = pattern[:-1]
+            return lambda text: text.startswith(prefix)
 
-        return fnmatch.fnmatch(text, pattern)
+        return re.compile(fnmatch.translate(pattern)).match
 
     async def health_check(self) -> dict[str, Any]:
         """Check S3 health and return metrics."""
@@ -9,7 +9,7 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from .backends import CacheBackend
-from .utils import CacheKeyGenerator
+from .utils import CACHE_TYPE_METADATA, CACHE_TYPE_TILE, CacheKeyGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -107,18 +107,10 @@ def _generate_cache_key(
     cache_type: str,
     exclude_params: Optional[list[str]],
 ) -> str:
-    """Generate cache key with temporary parameter exclusions."""
-    # Temporarily add exclude_params to key generator
-    original_excludes = key_generator.exclude_params.copy()
-    if exclude_params:
-        key_generator.exclude_params.update(exclude_params)
-
-    try:
-        cache_key = key_generator.from_request(request, cache_type)
-        return cache_key
-    finally:
-        # Restore original excludes
-        key_generator.exclude_params = original_excludes
+    """Generate cache key, excluding the decorator's extra parameters."""
+    return key_generator.from_request(
+        request, cache_type, exclude_params=exclude_params
+    )
 
 
 async def _handle_cache_miss(
@@ -153,7 +145,7 @@ async def _handle_cache_miss(
 def cached_tile(
     cache_backend: CacheBackend,
     key_generator: CacheKeyGenerator,
-    cache_type: str = "tile",
+    cache_type: str = CACHE_TYPE_TILE,
     ttl: Optional[int] = None,
     exclude_params: Optional[list[str]] = None,
 ) -> Callable:
@@ -230,7 +222,7 @@ def cached_tile(
 def cached_metadata(
     cache_backend: CacheBackend,
     key_generator: CacheKeyGenerator,
-    cache_type: str = "metadata",
+    cache_type: str = CACHE_TYPE_METADATA,
     ttl: Optional[int] = None,
 ) -> Callable:
     """Decorator for caching metadata endpoint responses.
@@ -313,7 +305,7 @@ class CacheManager:
         cache_backend: CacheBackend,
         key_generator: CacheKeyGenerator,
         request: Request,
-        cache_type: str = "tile",
+        cache_type: str = CACHE_TYPE_TILE,
         ttl: Optional[int] = None,
     ):
         """Initialize cache manager.
@@ -10,7 +10,16 @@ from starlette.responses import Response
 from starlette.types import ASGIApp
 
 from .backends import CacheBackend
-from .utils import CacheKeyGenerator
+from .utils import (
+    CACHE_TYPE_CROP,
+    CACHE_TYPE_INFO,
+    CACHE_TYPE_PREVIEW,
+    CACHE_TYPE_STATISTICS,
+    CACHE_TYPE_TILE,
+    CACHE_TYPE_TILEJSON,
+    CACHE_TYPE_UNKNOWN,
+    CacheKeyGenerator,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -156,19 +165,19 @@ class TileCacheMiddleware(BaseHTTPMiddleware):
             Cache type string
         """
         if "/tiles/" in path:
-            return "tile"
+            return CACHE_TYPE_TILE
         elif path.endswith("/tilejson.json"):
-            return "tilejson"
+            return CACHE_TYPE_TILEJSON
         elif "/preview" in path:
-            return "preview"
+            return CACHE_TYPE_PREVIEW
         elif "/crop/" in path:
-            return "crop"
+            return CACHE_TYPE_CROP
         elif "/statistics" in path:
-            return "statistics"
+            return CACHE_TYPE_STATISTICS
         elif path.endswith("/info.json"):
-            return "info"
+            return CACHE_TYPE_INFO
         else:
-            return "unknown"
+            return CACHE_TYPE_UNKNOWN
 
     async def _get_cached_response(self, cache_key: str) -> Optional[Response]:
         """Retrieve cached response.
@@ -1,5 +1,27 @@
 """Cache utilities and helpers."""
 
-from .keys import CacheKeyGenerator
+from .keys import (
+    CACHE_TYPE_CROP,
+    CACHE_TYPE_INFO,
+    CACHE_TYPE_METADATA,
+    CACHE_TYPE_PREVIEW,
+    CACHE_TYPE_STATISTICS,
+    CACHE_TYPE_TILE,
+    CACHE_TYPE_TILEJSON,
+    CACHE_TYPE_UNKNOWN,
+    CacheKeyGenerator,
+    get_generator,
+)
 
-__all__ = ["CacheKeyGenerator"]
+__all__ = [
+    "CacheKeyGenerator",
+    "CACHE_TYPE_CROP",
+    "CACHE_TYPE_INFO",
+    "CACHE_TYPE_METADATA",
+    "CACHE_TYPE_PREVIEW",
+    "CACHE_TYPE_STATISTICS",
+    "CACHE_TYPE_TILE",
+    "CACHE_TYPE_TILEJSON",
+    "CACHE_TYPE_UNKNOWN",
+    "get_generator",
+]
@@ -1,14 +1,31 @@
 """Cache key generation utilities."""
 
+import base64
 import hashlib
 import logging
-from typing import Optional
-from urllib.parse import urlencode, urlparse
+import sys
+from functools import cache
+from typing import Any, Iterable, Optional
+from urllib.parse import urlencode
 
 from starlette.requests import Request
 
 logger = logging.getLogger(__name__)
 
+# ASGI scope entry holding the parsed request path, so the path is parsed once
+# per request however many times a key is generated for it.
+PATH_PARTS_SCOPE_KEY = "titiler.cache.path_parts"
+
+# Cache types, interned so comparisons against them are identity checks
+CACHE_TYPE_TILE = sys.intern("tile")
+CACHE_TYPE_TILEJSON = sys.intern("tilejson")
+CACHE_TYPE_PREVIEW = sys.intern("preview")
+CACHE_TYPE_CROP = sys.intern("crop")
+CACHE_TYPE_STATISTICS = sys.intern("statistics")
+CACHE_TYPE_INFO = sys.intern("info")
+CACHE_TYPE_METADATA = sys.intern("metadata")
+CACHE_TYPE_UNKNOWN = sys.intern("unknown")
+
 
 class CacheKeyGenerator:
     """Generate deterministic cache keys from HTTP requests.
@@ -30,15 +47,39 @@ class CacheKeyGenerator:
             exclude_params: Query parameters to exclude from cache keys
             max_key_length: Maximum cache key length (for Redis compatibility, default 2048)
         """
-        self.namespace = namespace
-        self.exclude_params = set(exclude_params or [])
-        self.max_key_length = max_key_length
+        # Interned: the namespace prefixes every key and pattern we build
+        self._namespace = sys.intern(namespace)
+        self._max_key_length = max_key_length
+        self._exclude_params = frozenset(exclude_params or [])
+
+        # Case-folded once for (Unicode-aware) case-insensitive filtering
+        self._exclude_casefold = frozenset(p.casefold() for p in self._exclude_params)
+
+    @property
+    def namespace(self) -> str:
+        """Application namespace prefixing every key."""
+        return self._namespace
+
+    @property
+    def max_key_length(self) -> int:
+        """Maximum cache key length."""
+        return self._max_key_length
+
+    @property
+    def exclude_params(self) -> frozenset[str]:
+        """Query parameters excluded from cache keys.
+
+        Read-only, as generators are shared (see `get_generator`): pass
+        `exclude_params` to `from_request` to exclude more parameters for a key.
+        """
+        return self._exclude_params
 
     def from_request(
         self,
         request: Request,
-        cache_type: str = "tile",
+        cache_type: str = CACHE_TYPE_TILE,
         extra_params: Optional[dict[str, str]] = None,
+        exclude_params: Optional[Iterable[str]] = None,
     ) -> str:
         """Generate cache key from HTTP request.
 
@@ -46,16 +87,19 @@ class CacheKeyGenerator:
             request: Starlette/FastAPI request object
             cache_type: Type of cache (e.g., "tile", "tilejson", "preview")
             extra_params: Additional parameters to include in key
+            exclude_params: Query parameters to exclude from this key only, on
+                top of the generator's `exclude_params`
 
         Returns:
             Deterministic cache key string
         """
-        # Parse URL components
-        parsed_url = urlparse(str(request.url))
-        path_parts = self._parse_path(parsed_url.path)
+        # Parse URL components (memoized on the request scope)
+        path_parts = self._parse_request_path(request)
 
         # Filter and normalize query parameters
-        cache_params = self._filter_query_params(dict(request.query_params))
+        cache_params = self._filter_query_params(
+            dict(request.query_params), exclude_params
+        )
 
         # Add extra parameters if provided
         if extra_params:
@@ -65,18 +109,30 @@ class CacheKeyGenerator:
         params_hash = self._generate_params_hash(cache_params)
 
         # Construct cache key with namespace
-        key_parts = [self.namespace, cache_type] + path_parts + [params_hash]
-        cache_key = ":".join(str(part) for part in key_parts if part)
-
-        # Ensure key length is within limits
-        if len(cache_key) > self.max_key_length:
-            # Hash the entire key if too long
-            key_hash = hashlib.md5(cache_key.encode("utf-8")).hexdigest()
-            cache_key = f"{self.namespace}:{cache_type}:hash:{key_hash}"
+        cache_key = self._build_key(cache_type, path_parts, params_hash)
 
         logger.debug(f"Generated cache key: {cache_key}")
         return cache_key
 
+    def _parse_request_path(self, request: Request) -> list[str]:
+        """Parse the request URL path, reusing the result stored in `request.scope`.
+
+        Args:
+            request: Starlette/FastAPI request object
+
+        Returns:
+            List of path components relevant for caching
+        """
+        scope = getattr(request, "scope", None)
+        if scope is not None and PATH_PARTS_SCOPE_KEY in scope:
+            return scope[PATH_PARTS_SCOPE_KEY]
+
+        path_parts = self._parse_path(request.url.path)
+        if scope is not None:
+            scope[PATH_PARTS_SCOPE_KEY] = path_parts
+
+        return path_parts
+
     def _parse_path(self, path: str) -> list[str]:
         """Parse URL path into cache key components.
 
@@ -86,46 +142,56 @@ class CacheKeyGenerator:
         Returns:
             List of path components relevant for caching
         """
-        # Remove leading/trailing slashes and split
-        path_parts = path.strip("/").split("/")
+        # Split and remove empty parts (including leading/trailing slashes)
+        path_parts = [part for part in path.split("/") if part]
+        if not path_parts:
+            return []
 
-        # Remove empty parts
-        path_parts = [part for part in path_parts if part]
-
-        # Remove file extensions from the last part
-        if path_parts and "." in path_parts[-1]:
-            last_part = path_parts[-1]
-            path_parts[-1] = last_part.split(".")[0]
+        # Remove the file extension (e.g. `.png`, `.json`) from the last part:
+        # only the final, alphanumeric suffix of at most 8 characters
+        head, dot, ext = path_parts[-1].rpartition(".")
+        if dot and head and ext.isalnum() and len(ext) <= 8:
+            path_parts[-1] = head
 
         return path_parts
 
-    def _filter_query_params(self, query_params: dict[str, str]) -> dict[str, str]:
+    def _filter_query_params(
+        self,
+        query_params: dict[str, str],
+        exclude_params: Optional[Iterable[str]] = None,
+    ) -> dict[str, str]:
         """Filter and normalize query parameters for caching.
 
         Args:
             query_params: Raw query parameters from request
+            exclude_params: Query parameters to exclude, on top of the generator's
 
         Returns:
             Filtered parameters dict suitable for cache key generation
         """
-        filtered_params = {}
-
-        for key, value in query_params.items():
-            # Skip excluded parameters
-            if key.lower() in {p.lower() for p in self.exclude_params}:
-                logger.debug(f"Excluding parameter from cache key: {key}")
-                continue
-
-            # Handle multiple values (take first for consistency)
-            if isinstance(value, list):
-                value = value[0] if value else ""
-
-            # Normalize parameter value
-            normalized_value = str(value).strip()
-            if normalized_value:
-                filtered_params[key] = normalized_value
-
-        return filtered_params
+        exclude = self._exclude_casefold
+        if exclude_params:
+            exclude = exclude | {p.casefold() for p in exclude_params}
+
+        # Skip excluded parameters and normalize the remaining values
+        normalized_params = (
+            (key, self._normalize_param_value(value))
+            for key, value in query_params.items()
+            if key.casefold() not in exclude
+        )
+
+        # Drop parameters with empty values
+        return {key: value for key, value in normalized_params if value}
+
+    @staticmethod
+    def _normalize_param_value(value: Any) -> str:
+        """Normalize a query parameter value for caching."""
+        # Handle multiple values (take first for consistency). Query parsing
+        # yields plain lists, so an exact type check is enough
+        if type(value) is list:
+            value = value[0] if value else ""
+
+        return str(value).strip()
 
     def _generate_params_hash(self, params: dict[str, str]) -> str:
         """Generate deterministic hash from parameters.
@@ -139,23 +205,18 @@ class CacheKeyGenerator:
         if not params:
             return "noparams"
 
-        # Sort parameters alphabetically for deterministic output
-        sorted_params = sorted(params.items())
-
-        # Create URL-encoded string
-        params_string = urlencode(sorted_params)
-
-        # Generate hash
-        params_hash = hashlib.md5(params_string.encode("utf-8")).hexdigest()
+        # Alphabetically sorted and URL-encoded: separators inside keys or
+        # values are escaped, so different parameters never share a string
+        params_string = urlencode(sorted(params.items()))
 
-        # Return first 8 characters for shorter keys
-        return params_hash[:8]
+        # 4-byte BLAKE2b digest -> 8 hex characters for shorter keys
+        return hashlib.blake2b(params_string.encode("utf-8"), digest_size=4).hexdigest()
 
     def from_path_and_params(
         self,
         path: str,
         query_params: Optional[dict[str, str]] = None,
-        cache_type: str = "tile",
+        cache_type: str = CACHE_TYPE_TILE,
         extra_params: Optional[dict[str, str]] = None,
     ) -> str:
         """Generate cache key from path and parameters directly.
@@ -185,15 +246,44 @@ class CacheKeyGenerator:
         params_hash = self._generate_params_hash(cache_params)
 
         # Construct key
-        key_parts = [self.namespace, cache_type] + path_parts + [params_hash]
-        cache_key = ":".join(str(part) for part in key_parts if part)
+        return self._build_key(cache_type, path_parts, params_hash)
 
-        # Ensure key length
-        if len(cache_key) > self.max_key_length:
-            key_hash = hashlib.md5(cache_key.encode("utf-8")).hexdigest()
-            cache_key = f"{self.namespace}:{cache_type}:hash:{key_hash}"
+    def _build_key(
+        self, cache_type: str, path_parts: list[str], params_hash: str
+    ) -> str:
+        """Join the key components, hashing the whole key if it is too long.
 
-        return cache_key
+        Args:
+            cache_type: Type of cache
+            path_parts: Parsed path components
+            params_hash: Hash of the cache parameters
+
+        Returns:
+            Cache key string
+        """
+        # Assemble all the parts in one list so `str.join` builds the key in one go
+        key_parts = [part for part in (self.namespace, cache_type) if part]
+        key_parts.extend(path_parts)
+        key_parts.append(params_hash)
+
+        # Length of the joined key: all the parts plus one `:` between each of them
+        key_length = sum(map(len, key_parts)) + len(key_parts) - 1
+        if key_length <= self.max_key_length:
+            return ":".join(key_parts)
+
+        # Hash the entire key if too long (128-bit digest, 22 base64url chars),
+        # feeding the parts directly instead of building the oversized key
+        key_digest = hashlib.blake2b(digest_size=16)
+        separator = b""
+        for part in key_parts:
+            key_digest.update(separator)
+            key_digest.update(part.encode("utf-8"))
+            separator = b":"
+
+        key_hash = (
+            base64.urlsafe_b64encode(key_digest.digest()).rstrip(b"=").decode("ascii")
+        )
+        return f"{self.namespace}:{cache_type}:hash:{key_hash}"
 
     def get_pattern_for_collection(self, collection_id: str) -> str:
         """Generate Redis pattern for all cache entries of a collection.
@@ -228,3 +318,25 @@ class CacheKeyGenerator:
             Redis glob pattern string
         """
         return f"{self.namespace}:{cache_type}:*"
+
+
+@cache
+def get_generator(
+    namespace: str,
+    exclude_params: tuple[str, ...] = (),
+    max_key_length: int = 2048,
+) -> CacheKeyGenerator:
+    """Return a shared CacheKeyGenerator for the given configuration.
+
+    Identical configurations reuse the same instance, which is safe as
+    generators are read-only.
+
+    Args:
+        namespace: Application namespace (e.g., "titiler-eopf", "my-app")
+        exclude_params: Query parameters to exclude from cache keys
+        max_key_length: Maximum cache key length
+
+    Returns:
+        CacheKeyGenerator instance
+    """
+    return CacheKeyGenerator(namespace, list(exclude_params), max_key_length)
@@ -14,11 +14,7 @@ from starlette.requests import Request
 from starlette.templating import Jinja2Templates
 from starlette_cramjam.middleware import CompressionMiddleware
 
-from titiler.cache import (
-    CacheKeyGenerator,
-    TileCacheMiddleware,
-    create_cache_admin_router,
-)
+from titiler.cache import TileCacheMiddleware, create_cache_admin_router, get_generator
 from titiler.cache.backends.redis import RedisCacheBackend
 from titiler.cache.backends.s3 import S3StorageBackend
 from titiler.cache.backends.s3_redis import S3RedisCacheBackend
@@ -67,9 +63,9 @@ def setup_cache_system():
     logger.info(f"Setting up cache system with backend: {cache_settings.backend}")
 
     # Create cache key generator
-    key_generator = CacheKeyGenerator(
+    key_generator = get_generator(
         namespace=cache_settings.namespace,
-        exclude_params=cache_settings.exclude_params,
+        exclude_params=tuple(cache_settings.exclude_params),
         max_key_length=2048,
     )
 
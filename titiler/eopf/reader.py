@@ -12,6 +12,7 @@ import time
 import warnings
 from collections.abc import Callable
 from functools import cached_property, lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Literal
 from urllib.parse import urlparse
@@ -278,7 +279,7 @@ def get_multiscale_level(
     # Iterate over zoom levels from lowest/coarsest to highest/finest. If the `target_res` is more than `percentage`
     # percent of the way from the zoom level below to the zoom level above, then upsample the zoom level below, else
     # downsample the zoom level above.
-    available_resolutions = sorted(ms_resolutions, key=lambda x: x[1], reverse=True)
+    available_resolutions = sorted(ms_resolutions, key=itemgetter(1), reverse=True)
     if len(available_resolutions) == 1:
         return available_resolutions[0][0]
 
@@ -508,6 +509,17 @@ class GeoZarrReader(BaseReader):
     groups: list[str] = attr.ib(init=False)
     variables: list[str] = attr.ib(init=False)
 
+    # Info per `(variable, sel)`, filled lazily by `info()`
+    _info_cache: dict[tuple[str, tuple[str, ...] | None], Info] = attr.ib(
+        init=False, factory=dict
+    )
+
+    # Unconstrained `_get_variable` result per `(group, variable)`, as the
+    # default (finest) level only depends on the metadata
+    _default_variable_cache: dict[tuple[str, str], xarray.DataArray] = attr.ib(
+        init=False, factory=dict
+    )
+
     def __attrs_post_init__(self) -> None:
         """Set bounds and CRS."""
         if not self.datatree:
@@ -542,6 +554,11 @@ class GeoZarrReader(BaseReader):
         self.minzoom = self.minzoom if self.minzoom is not None else self.tms.minzoom
         self.maxzoom = self.maxzoom if self.maxzoom is not None else self.tms.maxzoom
 
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Support using with Context Managers."""
+        self._info_cache.clear()
+        self._default_variable_cache.clear()
+
     def _get_groups(self) -> list[str]:  # noqa: C901
         """return GeoZARR groups within the datatree."""
         groups: list[str] = []
@@ -778,6 +795,12 @@ class GeoZarrReader(BaseReader):
             )
             max_size = None
 
+        # Shallow copies are handed out, so callers changing `attrs` or coords
+        # in place do not alter the cached DataArray
+        default = not any([sel, bounds, height, width, max_size, dst_crs])
+        if default and (group, variable) in self._default_variable_cache:
+            return self._default_variable_cache[(group, variable)].copy(deep=False)
+
         tree = self.datatree[group]
         conventions = tree.attrs.get("zarr_conventions", [])
 
@@ -976,6 +999,10 @@ class GeoZarrReader(BaseReader):
             3,
         ], "rio_tiler.io.xarray.DatasetReader can only work with 2D or 3D DataArray"
 
+        if default:
+            self._default_variable_cache[(group, variable)] = da
+            return da.copy(deep=False)
+
         return da
 
     @cached_property
@@ -1035,12 +1062,20 @@ class GeoZarrReader(BaseReader):
                 logger.info(f"Failed to get info for variable '{group_var}': {e!s}")
                 return None
 
-        # Build result dictionary, skipping variables that failed
+        # Build result dictionary, skipping variables that failed. Successful
+        # results are cached so later calls (e.g. on a subset) skip the lookups,
+        # and copies are handed out so callers cannot alter the cached Info
+        sel_key = tuple(sel) if sel else None
         result = {}
         for gv in variables:
-            info_data = _get_info_safe(gv)
-            if info_data is not None:
-                result[gv] = info_data
+            if (info_data := self._info_cache.get((gv, sel_key))) is None:
+                info_data = _get_info_safe(gv)
+                if info_data is None:
+                    continue
+
+                self._info_cache[(gv, sel_key)] = info_data
+
+            result[gv] = info_data.model_copy(deep=True)
         return result
 
     def statistics(  # type: ignore